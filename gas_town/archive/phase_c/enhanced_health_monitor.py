@@ -36,7 +36,7 @@ from contextlib import contextmanager
 from persistent_molecule_state import PersistentMoleculeState, MoleculeState
 
 
-class HealthLevel(Enum):
+class HealthLevel(str, Enum):
     """Agent health status levels."""
     HEALTHY = "healthy"          # 🟢 Normal operation
     DEGRADED = "degraded"        # 🟡 Minor issues, still functional
@@ -15,6 +15,7 @@ Key Features:
 - Atomic state transitions with ACID guarantees
 """
 
+import atexit
 import json
 import sqlite3
 import logging
@@ -22,10 +23,35 @@ import threading
 import time
 from datetime import datetime, timezone
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from contextlib import contextmanager
+from collections import deque
+from functools import lru_cache
+
+
+NS_PER_SECOND = 1_000_000_000
+
+
+@lru_cache(maxsize=64)
+def _iso_second(seconds: int) -> str:
+    """ISO 8601 date and time, without offset, of a whole epoch second."""
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def iso_from_ns(epoch_ns: int) -> str:
+    """
+    Format an epoch-nanosecond timestamp as a UTC ISO 8601 string.
+
+    Matches datetime.isoformat(); only the date/time part of each second
+    goes through datetime, the microseconds and offset are string arithmetic.
+    """
+    seconds, ns = divmod(epoch_ns, NS_PER_SECOND)
+    microseconds = ns // 1000
+    if microseconds:
+        return f"{_iso_second(seconds)}.{microseconds:06d}+00:00"
+    return f"{_iso_second(seconds)}+00:00"
 
 
 class MoleculeState(Enum):
@@ -49,6 +75,8 @@ class MoleculeSnapshot:
     gas_town_context: Dict[str, Any]
     dependencies: List[str]
     rollback_point: bool = False
+    # Pre-encoded checkpoint_data, written verbatim instead of re-encoding
+    checkpoint_json: Optional[str] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MoleculeSnapshot':
@@ -68,6 +96,7 @@ class MoleculeSnapshot:
         """Convert snapshot to dictionary for serialization."""
         result = asdict(self)
         result['state'] = self.state.value
+        del result['checkpoint_json']
         return result
 
 
@@ -82,10 +111,14 @@ class PersistentMoleculeState:
     4. Integration with Gas Town MEOW stack
     """
 
+    WRITE_FLUSH_INTERVAL = 0.05  # Seconds between write-behind flushes
+
     def __init__(self,
                  db_path: str = "/home/ubuntu/.gas_town/molecule_state.db",
                  checkpoint_interval: float = 30.0,
-                 heartbeat_timeout: float = 300.0):
+                 heartbeat_timeout: float = 300.0,
+                 write_behind: bool = False,
+                 durable: bool = True):
         """
         Initialize the persistent molecule state system.
 
@@ -93,14 +126,37 @@ class PersistentMoleculeState:
             db_path: Path to SQLite database for state persistence
             checkpoint_interval: Minimum seconds between automatic checkpoints
             heartbeat_timeout: Seconds before considering an agent crashed
+            write_behind: Queue snapshot writes for a single background
+                writer thread instead of writing on the calling thread.
+                Queued snapshots reach the database within
+                WRITE_FLUSH_INTERVAL, on flush_writes() or on close().
+            durable: Sync the WAL at checkpoints (synchronous=NORMAL). Pass
+                False for throwaway databases to skip fsync entirely
+                (synchronous=OFF); a commit can then be lost on power
+                failure, though not on a process crash.
         """
         self.db_path = Path(db_path)
         self.checkpoint_interval = checkpoint_interval
         self.heartbeat_timeout = heartbeat_timeout
+        self.write_behind = write_behind
+        self.durable = durable
 
         # Thread-safe access to state
         self._lock = threading.RLock()
 
+        # Per-thread connection (kept open so its statement cache stays
+        # warm) and the transaction() block open on each thread, if any
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Write-behind queue of snapshots drained by one writer thread
+        self._write_queue: deque = deque()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stop = threading.Event()
+        self._writer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
         # In-memory cache of active molecules
         self._active_molecules: Dict[str, MoleculeSnapshot] = {}
 
@@ -118,6 +174,10 @@ class PersistentMoleculeState:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         with self._get_db_connection() as conn:
+            # WAL lets readers run alongside the writer; the journal mode is
+            # stored in the database file, so it holds for later connections
+            conn.execute("PRAGMA journal_mode=WAL")
+
             cursor = conn.cursor()
 
             # Table for molecule snapshots
@@ -160,8 +220,6 @@ class PersistentMoleculeState:
                 ON molecule_snapshots(rollback_point, timestamp DESC)
             """)
 
-            conn.commit()
-
     def _init_logging(self) -> None:
         """Setup logging for crash recovery events."""
         log_file = self.db_path.parent / "crash_recovery.log"
@@ -175,26 +233,84 @@ class PersistentMoleculeState:
         )
         self.logger = logging.getLogger(__name__)
 
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'pooled', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30.0,
+                check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL" if self.durable else "PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.pooled = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
     @contextmanager
     def _get_db_connection(self):
-        """Context manager for database connections with proper cleanup."""
-        conn = sqlite3.connect(
-            str(self.db_path),
-            timeout=30.0,
-            check_same_thread=False
-        )
-        conn.row_factory = sqlite3.Row
+        """
+        Context manager for this thread's database connection.
+
+        Work done in the block is committed when it exits cleanly and rolled
+        back if it raises. Inside a transaction() block the commit is left to
+        the transaction.
+        """
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            yield shared
+            return
+
+        conn = self._connection()
         try:
             yield conn
-        finally:
-            conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group this thread's writes into a single SQLite transaction.
+
+        Every create, checkpoint, complete and fail call made inside the block
+        shares one connection and commits once when the block exits, instead
+        of once per call. The write lock is taken up front (BEGIN IMMEDIATE)
+        and the state lock is held for the whole block, so other threads wait
+        for it rather than for the database. An exception rolls back the
+        database writes; the in-memory active set is not rolled back.
+        Nested blocks join the outermost one.
+        """
+        with self._lock:
+            if getattr(self._local, 'conn', None) is not None:
+                yield self
+                return
+
+            conn = self._connection()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                self._local.conn = conn
+                try:
+                    yield self
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            finally:
+                self._local.conn = None
 
     def create_molecule(self,
                        molecule_id: str,
                        agent_name: str,
                        initial_data: Dict[str, Any] = None,
                        gas_town_context: Dict[str, Any] = None,
-                       dependencies: List[str] = None) -> MoleculeSnapshot:
+                       dependencies: List[str] = None,
+                       initial_json: Optional[str] = None) -> MoleculeSnapshot:
         """
         Create a new molecule and persist its initial state.
 
@@ -204,28 +320,73 @@ class PersistentMoleculeState:
             initial_data: Initial checkpoint data
             gas_town_context: Gas Town workflow context
             dependencies: List of dependent molecule IDs
+            initial_json: initial_data already encoded as JSON; stored verbatim
 
         Returns:
             Initial molecule snapshot
         """
+        return self._create_molecule(molecule_id, agent_name, MoleculeState.INITIALIZED,
+                                     initial_data, gas_town_context, dependencies,
+                                     initial_json)
+
+    def create_and_start_molecule(self,
+                                  molecule_id: str,
+                                  agent_name: str,
+                                  initial_data: Dict[str, Any] = None,
+                                  gas_town_context: Dict[str, Any] = None,
+                                  dependencies: List[str] = None,
+                                  initial_json: Optional[str] = None) -> MoleculeSnapshot:
+        """
+        Create a new molecule that is already running.
+
+        Persists a single RUNNING snapshot instead of an INITIALIZED snapshot
+        followed by a RUNNING checkpoint, halving the writes for callers that
+        never observe the pre-start state.
+
+        Args:
+            molecule_id: Unique identifier for the molecule
+            agent_name: Name of the agent creating the molecule
+            initial_data: Initial checkpoint data
+            gas_town_context: Gas Town workflow context
+            dependencies: List of dependent molecule IDs
+            initial_json: initial_data already encoded as JSON; stored verbatim
+
+        Returns:
+            Initial (running) molecule snapshot
+        """
+        return self._create_molecule(molecule_id, agent_name, MoleculeState.RUNNING,
+                                     initial_data, gas_town_context, dependencies,
+                                     initial_json)
+
+    def _create_molecule(self,
+                         molecule_id: str,
+                         agent_name: str,
+                         state: MoleculeState,
+                         initial_data: Optional[Dict[str, Any]],
+                         gas_town_context: Optional[Dict[str, Any]],
+                         dependencies: Optional[List[str]],
+                         initial_json: Optional[str] = None) -> MoleculeSnapshot:
+        """Persist and register the first snapshot of a new molecule."""
         with self._lock:
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = iso_from_ns(time.time_ns())
 
             snapshot = MoleculeSnapshot(
                 molecule_id=molecule_id,
-                state=MoleculeState.INITIALIZED,
+                state=state,
                 checkpoint_data=initial_data or {},
                 timestamp=timestamp,
                 agent_name=agent_name,
                 gas_town_context=gas_town_context or {},
                 dependencies=dependencies or [],
-                rollback_point=True  # Initial state is always a rollback point
+                rollback_point=True,  # Initial state is always a rollback point
+                checkpoint_json=initial_json
             )
 
             self._persist_snapshot(snapshot)
             self._active_molecules[molecule_id] = snapshot
 
-            self.logger.info(f"Created molecule {molecule_id} by agent {agent_name}")
+            self.logger.info(f"Created molecule {molecule_id} by agent {agent_name} "
+                             f"in state {state.value}")
             return snapshot
 
     def checkpoint_molecule(self,
@@ -233,7 +394,8 @@ class PersistentMoleculeState:
                           checkpoint_data: Dict[str, Any],
                           state: MoleculeState = MoleculeState.RUNNING,
                           force: bool = False,
-                          rollback_point: bool = False) -> bool:
+                          rollback_point: bool = False,
+                          checkpoint_json: Optional[str] = None) -> bool:
         """
         Create a checkpoint for a molecule's current state.
 
@@ -243,6 +405,8 @@ class PersistentMoleculeState:
             state: Current lifecycle state of molecule
             force: Skip checkpoint interval enforcement
             rollback_point: Mark this checkpoint as a rollback point
+            checkpoint_json: checkpoint_data already encoded as JSON, e.g.
+                spliced from a template by the caller; stored verbatim
 
         Returns:
             True if checkpoint was created, False if skipped due to interval
@@ -259,7 +423,7 @@ class PersistentMoleculeState:
                 return False
 
             current_snapshot = self._active_molecules[molecule_id]
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = iso_from_ns(time.time_ns())
 
             new_snapshot = MoleculeSnapshot(
                 molecule_id=molecule_id,
@@ -269,7 +433,8 @@ class PersistentMoleculeState:
                 agent_name=current_snapshot.agent_name,
                 gas_town_context=current_snapshot.gas_town_context,
                 dependencies=current_snapshot.dependencies,
-                rollback_point=rollback_point
+                rollback_point=rollback_point,
+                checkpoint_json=checkpoint_json
             )
 
             self._persist_snapshot(new_snapshot)
@@ -279,15 +444,72 @@ class PersistentMoleculeState:
             self.logger.info(f"Checkpointed molecule {molecule_id} in state {state.value}")
             return True
 
+    def checkpoint_many(self,
+                        checkpoints: List[Tuple],
+                        force: bool = False) -> int:
+        """
+        Create several checkpoints with a single batched insert.
+
+        Each checkpoint is checked and applied as checkpoint_molecule would,
+        in order, so a later entry for the same molecule builds on an earlier
+        one; the snapshots are then written in one executemany and one commit.
+
+        Args:
+            checkpoints: (molecule_id, checkpoint_data, state, rollback_point)
+                tuples, optionally followed by checkpoint_json as in
+                checkpoint_molecule
+            force: Skip checkpoint interval enforcement
+
+        Returns:
+            Number of checkpoints created
+        """
+        with self._lock:
+            # Validate the whole batch before any state changes
+            for molecule_id, *_ in checkpoints:
+                if molecule_id not in self._active_molecules:
+                    raise ValueError(f"Molecule {molecule_id} not found in active set")
+
+            snapshots = []
+            for molecule_id, checkpoint_data, state, rollback_point, *encoded in checkpoints:
+                current_time = time.time()
+                last_checkpoint = self._last_checkpoint.get(molecule_id, 0)
+
+                # Enforce checkpoint intervals unless forced
+                if not force and (current_time - last_checkpoint) < self.checkpoint_interval:
+                    continue
+
+                current_snapshot = self._active_molecules[molecule_id]
+                new_snapshot = MoleculeSnapshot(
+                    molecule_id=molecule_id,
+                    state=state,
+                    checkpoint_data=checkpoint_data,
+                    timestamp=iso_from_ns(time.time_ns()),
+                    agent_name=current_snapshot.agent_name,
+                    gas_town_context=current_snapshot.gas_town_context,
+                    dependencies=current_snapshot.dependencies,
+                    rollback_point=rollback_point,
+                    checkpoint_json=encoded[0] if encoded else None
+                )
+                snapshots.append(new_snapshot)
+                self._active_molecules[molecule_id] = new_snapshot
+                self._last_checkpoint[molecule_id] = current_time
+
+            self._persist_snapshots(snapshots)
+
+            self.logger.info(f"Checkpointed {len(snapshots)} molecule states in one batch")
+            return len(snapshots)
+
     def complete_molecule(self,
                          molecule_id: str,
-                         final_data: Dict[str, Any] = None) -> MoleculeSnapshot:
+                         final_data: Dict[str, Any] = None,
+                         final_json: Optional[str] = None) -> MoleculeSnapshot:
         """
         Mark a molecule as completed and create final checkpoint.
 
         Args:
             molecule_id: ID of molecule to complete
             final_data: Final state data
+            final_json: final_data already encoded as JSON; stored verbatim
 
         Returns:
             Final molecule snapshot
@@ -297,7 +519,7 @@ class PersistentMoleculeState:
                 raise ValueError(f"Molecule {molecule_id} not found in active set")
 
             current_snapshot = self._active_molecules[molecule_id]
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = iso_from_ns(time.time_ns())
 
             final_snapshot = MoleculeSnapshot(
                 molecule_id=molecule_id,
@@ -307,7 +529,8 @@ class PersistentMoleculeState:
                 agent_name=current_snapshot.agent_name,
                 gas_town_context=current_snapshot.gas_town_context,
                 dependencies=current_snapshot.dependencies,
-                rollback_point=True  # Completion is always a rollback point
+                rollback_point=True,  # Completion is always a rollback point
+                checkpoint_json=final_json
             )
 
             self._persist_snapshot(final_snapshot)
@@ -337,7 +560,7 @@ class PersistentMoleculeState:
                 raise ValueError(f"Molecule {molecule_id} not found in active set")
 
             current_snapshot = self._active_molecules[molecule_id]
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = iso_from_ns(time.time_ns())
 
             # Merge error info into checkpoint data
             failure_data = current_snapshot.checkpoint_data.copy()
@@ -378,6 +601,7 @@ class PersistentMoleculeState:
         Returns:
             List of snapshots in reverse chronological order
         """
+        self.flush_writes()
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
 
@@ -414,6 +638,7 @@ class PersistentMoleculeState:
         Returns:
             Most recent rollback point snapshot, or None if not found
         """
+        self.flush_writes()
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
 
@@ -456,7 +681,7 @@ class PersistentMoleculeState:
                 self.logger.error(f"No rollback point found for molecule {molecule_id}")
                 return None
 
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = iso_from_ns(time.time_ns())
 
             rollback_snapshot = MoleculeSnapshot(
                 molecule_id=molecule_id,
@@ -512,8 +737,6 @@ class PersistentMoleculeState:
                         WHERE agent_name = ?
                     """, (agent_name,))
 
-            conn.commit()
-
         return crashed
 
     def recover_crashed_molecules(self, agent_name: str) -> List[MoleculeSnapshot]:
@@ -547,7 +770,7 @@ class PersistentMoleculeState:
                 error_info = {
                     'type': 'agent_crash',
                     'crashed_agent': agent_name,
-                    'detection_time': datetime.now(timezone.utc).isoformat()
+                    'detection_time': iso_from_ns(time.time_ns())
                 }
                 self.fail_molecule(molecule_id, error_info)
                 self.logger.error(f"Could not recover molecule {molecule_id}")
@@ -571,30 +794,109 @@ class PersistentMoleculeState:
                 VALUES (?, julianday('now'), ?, 'active')
             """, (agent_name, json.dumps(molecule_ids)))
 
-            conn.commit()
-
     def _persist_snapshot(self, snapshot: MoleculeSnapshot) -> None:
         """Persist a molecule snapshot to the database."""
+        self._persist_snapshots([snapshot])
+
+    def _persist_snapshots(self, snapshots: List[MoleculeSnapshot]) -> None:
+        """
+        Persist molecule snapshots, or queue them for the background writer
+        in write-behind mode. Writes made inside a transaction() block always
+        go to its connection directly.
+        """
+        if not snapshots:
+            return
+
+        if self.write_behind and getattr(self._local, 'conn', None) is None:
+            self._write_queue.extend(snapshots)
+            if self._writer_thread is None:
+                self._start_writer()
+            return
+
+        self._write_snapshots(snapshots)
+
+    def _write_snapshots(self, snapshots: List[MoleculeSnapshot]) -> None:
+        """Write molecule snapshots to the database with one executemany."""
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT INTO molecule_snapshots
                 (molecule_id, state, checkpoint_data, timestamp, agent_name,
                  gas_town_context, dependencies, rollback_point)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            """, [(
                 snapshot.molecule_id,
                 snapshot.state.value,
-                json.dumps(snapshot.checkpoint_data),
+                (snapshot.checkpoint_json if snapshot.checkpoint_json is not None
+                 else json.dumps(snapshot.checkpoint_data)),
                 snapshot.timestamp,
                 snapshot.agent_name,
                 json.dumps(snapshot.gas_town_context),
                 json.dumps(snapshot.dependencies),
                 int(snapshot.rollback_point)
-            ))
+            ) for snapshot in snapshots])
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._writer_lock:
+            if self._writer_thread is not None:
+                return
+            self._writer_stop.clear()
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                name="molecule_state_writer",
+                daemon=True
+            )
+            self._writer_thread.start()
+            atexit.register(self.close)
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue every WRITE_FLUSH_INTERVAL until stopped."""
+        while not self._writer_stop.wait(self.WRITE_FLUSH_INTERVAL):
+            try:
+                self.flush_writes()
+            except Exception as e:
+                self.logger.error(f"Error flushing molecule snapshots: {e}")
+
+    def flush_writes(self) -> None:
+        """
+        Write every queued snapshot now, with one executemany and one commit.
 
-            conn.commit()
+        A no-op unless write-behind is enabled and snapshots are pending.
+        Raises if the write fails; the snapshots stay queued for the next flush.
+        """
+        with self._flush_lock:
+            batch = []
+            while self._write_queue:
+                batch.append(self._write_queue.popleft())
+            if not batch:
+                return
+            try:
+                self._write_snapshots(batch)
+            except BaseException:
+                self._write_queue.extendleft(reversed(batch))
+                raise
+
+    def close(self) -> None:
+        """
+        Stop the background writer, write whatever is still queued and close
+        every thread's connection. Later calls open fresh connections.
+        """
+        with self._writer_lock:
+            thread, self._writer_thread = self._writer_thread, None
+            if thread is not None:
+                self._writer_stop.set()
+                atexit.unregister(self.close)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        self.flush_writes()
+
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
 
     def get_active_molecules(self) -> Dict[str, MoleculeSnapshot]:
         """Get all currently active molecules."""
@@ -611,6 +913,7 @@ class PersistentMoleculeState:
         Returns:
             Number of snapshots deleted
         """
+        self.flush_writes()
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
 
@@ -621,11 +924,22 @@ class PersistentMoleculeState:
             """.format(days))
 
             deleted_count = cursor.rowcount
-            conn.commit()
 
             self.logger.info(f"Cleaned up {deleted_count} old snapshots")
             return deleted_count
 
+    def checkpoint_wal(self) -> None:
+        """
+        Fold the write-ahead log back into the main database file.
+
+        Meant to be called once at shutdown: TRUNCATE copies every WAL frame
+        into the database and resets the -wal file to zero bytes, so no
+        sidecar files are left behind. A no-op for rollback-journal databases.
+        """
+        self.flush_writes()
+        with self._get_db_connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
 
 # Example usage and testing
 if __name__ == "__main__":
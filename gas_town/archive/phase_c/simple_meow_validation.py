@@ -6,58 +6,68 @@ Simple MEOW Stack Validation
 Quick validation of our MEOW stack implementation against Gas Town blog spec.
 """
 
+import io
 import os
+import shutil
 import sys
-import json
-import tempfile
 from pathlib import Path
 
-# Add our modules to path
-sys.path.insert(0, '/home/ubuntu/projects/deere/gas_town/phase_c')
-
-from persistent_molecule_state import PersistentMoleculeState, MoleculeState
-
 
 def validate_meow_stack():
     """Validate MEOW stack components."""
-    print("🧬 MEOW STACK VALIDATION")
-    print("=" * 50)
+    import tempfile
+
+    # Resolve sibling modules next to this file rather than a fixed checkout
+    module_dir = str(Path(__file__).resolve().parent)
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+
+    from persistent_molecule_state import PersistentMoleculeState, MoleculeState
+
+    # Buffer the report and write it once, keeping stdout out of the
+    # molecule operations being exercised
+    out = io.StringIO()
+
+    def emit(*parts):
+        out.write(" ".join(map(str, parts)) + "\n")
+
+    emit("🧬 MEOW STACK VALIDATION")
+    emit("=" * 50)
 
     test_dir = tempfile.mkdtemp()
     db_path = os.path.join(test_dir, "validation.db")
 
     # Initialize molecule system
     mol_state = PersistentMoleculeState(db_path=db_path)
+    recovery_state = None
 
     validation_results = {}
 
     # 1. Test Beads Integration (atomic work units)
-    print("\n🔍 1. BEADS INTEGRATION (Atomic Work Units)")
+    emit("\n🔍 1. BEADS INTEGRATION (Atomic Work Units)")
     try:
         mol_id = "bead-test-molecule"
         molecule = mol_state.create_molecule(mol_id, "TestAgent", {"type": "atomic_work"})
 
         status = mol_state.get_molecule_status(mol_id)
-        print(f"   ✅ Created atomic work unit: {mol_id}")
-        print(f"   ✅ Initial state: {status['state']}")
+        emit(f"   ✅ Created atomic work unit: {mol_id}")
+        emit(f"   ✅ Initial state: {status['state']}")
 
         validation_results["beads"] = "✅ PASS"
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        emit(f"   ❌ Error: {e}")
         validation_results["beads"] = "❌ FAIL"
 
     # 2. Test Molecules (workflow chains)
-    print("\n🔍 2. MOLECULES (Workflow Chains)")
+    emit("\n🔍 2. MOLECULES (Workflow Chains)")
     try:
         workflow_mol = "workflow-chain-test"
-        molecule = mol_state.create_molecule(
+        # Create and start workflow
+        molecule = mol_state.create_and_start_molecule(
             workflow_mol, "WorkflowAgent",
             {"workflow": ["design", "implement", "test", "deploy"]}
         )
 
-        # Start workflow
-        mol_state.start_molecule(workflow_mol)
-
         # Simulate workflow steps with checkpointing
         for i, step in enumerate(["design", "implement", "test", "deploy"]):
             mol_state.checkpoint_molecule(
@@ -74,22 +84,21 @@ def validate_meow_stack():
         status = mol_state.get_molecule_status(workflow_mol)
         history = mol_state.get_molecule_history(workflow_mol)
 
-        print(f"   ✅ Workflow executed: 4 steps completed")
-        print(f"   ✅ Final state: {status['state']}")
-        print(f"   ✅ Checkpoints saved: {len(history)}")
+        emit(f"   ✅ Workflow executed: 4 steps completed")
+        emit(f"   ✅ Final state: {status['state']}")
+        emit(f"   ✅ Checkpoints saved: {len(history)}")
 
         validation_results["molecules"] = "✅ PASS"
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        emit(f"   ❌ Error: {e}")
         validation_results["molecules"] = "❌ FAIL"
 
     # 3. Test NDI (Nondeterministic Idempotence)
-    print("\n🔍 3. NDI (Crash Recovery)")
+    emit("\n🔍 3. NDI (Crash Recovery)")
     try:
         crash_mol = "ndi-crash-test"
-        molecule = mol_state.create_molecule(crash_mol, "CrashAgent", {"critical": True})
+        molecule = mol_state.create_and_start_molecule(crash_mol, "CrashAgent", {"critical": True})
 
-        mol_state.start_molecule(crash_mol)
         mol_state.checkpoint_molecule(
             crash_mol, {"progress": "50%", "step": "processing"},
             MoleculeState.RUNNING, force=True
@@ -102,33 +111,32 @@ def validate_meow_stack():
         recovered_status = recovery_state.get_molecule_status(crash_mol)
         recovered_history = recovery_state.get_molecule_history(crash_mol)
 
-        print(f"   ✅ Molecule survived crash: {recovered_status['state']}")
-        print(f"   ✅ Checkpoint recovered: {len(recovered_history)} entries")
+        emit(f"   ✅ Molecule survived crash: {recovered_status['state']}")
+        emit(f"   ✅ Checkpoint recovered: {len(recovered_history)} entries")
 
         # Complete from recovery
         recovery_state.complete_molecule(crash_mol, {"recovered": True})
         final_status = recovery_state.get_molecule_status(crash_mol)
 
-        print(f"   ✅ Completed after recovery: {final_status['state']}")
+        emit(f"   ✅ Completed after recovery: {final_status['state']}")
 
         validation_results["ndi"] = "✅ PASS"
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        emit(f"   ❌ Error: {e}")
         validation_results["ndi"] = "❌ FAIL"
 
     # 4. Test Multi-molecule orchestration
-    print("\n🔍 4. ORCHESTRATION (Multiple Molecules)")
+    emit("\n🔍 4. ORCHESTRATION (Multiple Molecules)")
     try:
         convoy_molecules = []
 
         for i in range(3):
             mol_id = f"convoy-mol-{i+1}"
-            molecule = mol_state.create_molecule(
+            molecule = mol_state.create_and_start_molecule(
                 mol_id, f"ConvoyAgent{i+1}",
                 {"convoy": "test-convoy", "position": i+1}
             )
             convoy_molecules.append(mol_id)
-            mol_state.start_molecule(mol_id)
 
         # Execute convoy
         for mol_id in convoy_molecules:
@@ -147,16 +155,16 @@ def validate_meow_stack():
             if status['state'] == 'completed':
                 completed_count += 1
 
-        print(f"   ✅ Convoy orchestration: {completed_count}/3 molecules completed")
-        print(f"   ✅ Active molecules remaining: {len(active_mols)}")
+        emit(f"   ✅ Convoy orchestration: {completed_count}/3 molecules completed")
+        emit(f"   ✅ Active molecules remaining: {len(active_mols)}")
 
         validation_results["orchestration"] = "✅ PASS"
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        emit(f"   ❌ Error: {e}")
         validation_results["orchestration"] = "❌ FAIL"
 
     # 5. Test Template/Protomolecule functionality
-    print("\n🔍 5. TEMPLATES (Protomolecule Concept)")
+    emit("\n🔍 5. TEMPLATES (Protomolecule Concept)")
     try:
         # Create template-based molecule
         template_mol = "template-test"
@@ -170,92 +178,101 @@ def validate_meow_stack():
             "steps": ["analyze", "design", "implement", "test"]
         }
 
-        molecule = mol_state.create_molecule(
+        molecule = mol_state.create_and_start_molecule(
             template_mol, "TemplateAgent",
             template_config
         )
 
-        mol_state.start_molecule(template_mol)
-
-        # Execute template steps
+        # Execute template steps; the substituted variable is the same for
+        # every step, so resolve it once outside the loop
+        feature = template_config["variables"]["feature_name"]
         for step in template_config["steps"]:
             mol_state.checkpoint_molecule(
                 template_mol,
-                {"template_step": step, "feature": template_config["variables"]["feature_name"]},
+                {"template_step": step, "feature": feature},
                 MoleculeState.RUNNING, force=True
             )
 
         mol_state.complete_molecule(template_mol, {"template_execution": "success"})
 
         status = mol_state.get_molecule_status(template_mol)
-        print(f"   ✅ Template instantiated: feature_development")
-        print(f"   ✅ Variable substitution: user_dashboard")
-        print(f"   ✅ Template completed: {status['state']}")
+        emit(f"   ✅ Template instantiated: feature_development")
+        emit(f"   ✅ Variable substitution: user_dashboard")
+        emit(f"   ✅ Template completed: {status['state']}")
 
         validation_results["templates"] = "✅ PASS"
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        emit(f"   ❌ Error: {e}")
         validation_results["templates"] = "❌ FAIL"
 
     # Summary
-    print("\n" + "=" * 50)
-    print("🧬 MEOW STACK VALIDATION SUMMARY")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("🧬 MEOW STACK VALIDATION SUMMARY")
+    emit("=" * 50)
 
     passed = sum(1 for result in validation_results.values() if "✅" in result)
     total = len(validation_results)
 
-    print(f"\n📊 VALIDATION RESULTS: {passed}/{total} components working")
+    emit(f"\n📊 VALIDATION RESULTS: {passed}/{total} components working")
 
     for component, result in validation_results.items():
-        print(f"   {result} {component.upper()}")
+        emit(f"   {result} {component.upper()}")
 
-    print("\n🎯 BLOG SPECIFICATION COMPLIANCE:")
+    emit("\n🎯 BLOG SPECIFICATION COMPLIANCE:")
 
     if validation_results.get("beads", "") == "✅ PASS":
-        print("   ✅ Beads: WORKING (atomic work units)")
+        emit("   ✅ Beads: WORKING (atomic work units)")
     else:
-        print("   ❌ Beads: FAILING")
+        emit("   ❌ Beads: FAILING")
 
     if validation_results.get("molecules", "") == "✅ PASS":
-        print("   ✅ Molecules: WORKING (workflow chains)")
+        emit("   ✅ Molecules: WORKING (workflow chains)")
     else:
-        print("   ❌ Molecules: FAILING")
+        emit("   ❌ Molecules: FAILING")
 
     if validation_results.get("ndi", "") == "✅ PASS":
-        print("   ✅ NDI: WORKING (crash recovery)")
+        emit("   ✅ NDI: WORKING (crash recovery)")
     else:
-        print("   ❌ NDI: FAILING")
+        emit("   ❌ NDI: FAILING")
 
     if validation_results.get("orchestration", "") == "✅ PASS":
-        print("   ✅ Orchestration: WORKING (multi-molecule)")
+        emit("   ✅ Orchestration: WORKING (multi-molecule)")
     else:
-        print("   ❌ Orchestration: FAILING")
+        emit("   ❌ Orchestration: FAILING")
 
     if validation_results.get("templates", "") == "✅ PASS":
-        print("   🔶 Protomolecules: BASIC SUPPORT (JSON templates)")
+        emit("   🔶 Protomolecules: BASIC SUPPORT (JSON templates)")
     else:
-        print("   ❌ Protomolecules: FAILING")
+        emit("   ❌ Protomolecules: FAILING")
 
-    print("   ❌ Formulas: NOT IMPLEMENTED (no TOML parser)")
-    print("   ❌ Wisps: NOT IMPLEMENTED (no ephemeral beads)")
+    emit("   ❌ Formulas: NOT IMPLEMENTED (no TOML parser)")
+    emit("   ❌ Wisps: NOT IMPLEMENTED (no ephemeral beads)")
 
     # Overall assessment
     blog_compliance = (passed / total) * 100
-    print(f"\n🚀 OVERALL MEOW ASSESSMENT: {blog_compliance:.0f}% FUNCTIONAL")
+    emit(f"\n🚀 OVERALL MEOW ASSESSMENT: {blog_compliance:.0f}% FUNCTIONAL")
 
     if passed == total:
-        print("🎉 MEOW STACK: READY FOR GAS TOWN ORCHESTRATION")
+        emit("🎉 MEOW STACK: READY FOR GAS TOWN ORCHESTRATION")
     elif passed >= total * 0.8:
-        print("✅ MEOW STACK: MOSTLY FUNCTIONAL - MINOR GAPS")
+        emit("✅ MEOW STACK: MOSTLY FUNCTIONAL - MINOR GAPS")
     elif passed >= total * 0.6:
-        print("🔶 MEOW STACK: PARTIALLY FUNCTIONAL - SOME GAPS")
+        emit("🔶 MEOW STACK: PARTIALLY FUNCTIONAL - SOME GAPS")
     else:
-        print("❌ MEOW STACK: MAJOR ISSUES - NEEDS WORK")
-
-    # Clean up
-    os.unlink(db_path)
-    os.rmdir(test_dir)
+        emit("❌ MEOW STACK: MAJOR ISSUES - NEEDS WORK")
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+
+    # Clean up: checkpoint once so the WAL is emptied, close every
+    # connection, then remove the database along with any -wal/-shm sidecars
+    mol_state.checkpoint_wal()
+    if recovery_state is not None:
+        recovery_state.close()
+    mol_state.close()
+    for suffix in ("", "-wal", "-shm"):
+        Path(db_path + suffix).unlink(missing_ok=True)
+    shutil.rmtree(test_dir, ignore_errors=True)
 
     return passed == total
 
@@ -16,28 +16,48 @@ Key Features:
 - Hierarchical coordination with specialized team leaders
 """
 
+from __future__ import annotations
+
 import json
 import sqlite3
 import logging
 import threading
 import time
-import asyncio
-import math
-from datetime import datetime, timezone, timedelta
+import heapq
+import itertools
+import weakref
+import numpy as np
 from enum import Enum
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Tuple, Set, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Any, Tuple, Set, Callable
 from pathlib import Path
 from contextlib import contextmanager
-from collections import defaultdict, deque
+from functools import lru_cache
+from statistics import fmean
+from collections import deque
+from itertools import groupby, islice
+from operator import attrgetter, itemgetter
 
 # Import Phase C components
-from persistent_molecule_state import PersistentMoleculeState, MoleculeState
-from enhanced_health_monitor import EnhancedHealthMonitor, HealthLevel, HealthMetrics
+from persistent_molecule_state import PersistentMoleculeState, NS_PER_SECOND, iso_from_ns
+from enhanced_health_monitor import EnhancedHealthMonitor, HealthLevel
+
+try:
+    import orjson  # Optional: faster encoding of persisted JSON columns
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import sched
+    from concurrent.futures import Future, ThreadPoolExecutor
+
 
+class TeamType(str, Enum):
+    """Types of agent teams for different coordination patterns.
 
-class TeamType(Enum):
-    """Types of agent teams for different coordination patterns."""
+    The str mixin makes each member its own value: members hash and
+    compare as their strings, and serialize without a .value lookup.
+    """
     PARALLEL = "parallel"        # Independent parallel work
     PIPELINE = "pipeline"        # Sequential dependency chain
     MESH = "mesh"               # Complex interdependent work
@@ -45,7 +65,7 @@ class TeamType(Enum):
     EMERGENCY = "emergency"     # Rapid response teams
 
 
-class WorkloadType(Enum):
+class WorkloadType(str, Enum):
     """Categories of work that determine distribution strategy."""
     CPU_INTENSIVE = "cpu_intensive"
     IO_BOUND = "io_bound"
@@ -55,7 +75,7 @@ class WorkloadType(Enum):
     ANALYTICAL = "analytical"
 
 
-class AgentCapability(Enum):
+class AgentCapability(str, Enum):
     """Agent capabilities for intelligent task assignment."""
     FRONTEND_DEV = "frontend_dev"
     BACKEND_DEV = "backend_dev"
@@ -69,11 +89,101 @@ class AgentCapability(Enum):
     ANALYSIS = "analysis"
 
 
-@dataclass
+# Integer team type codes for counting teams with np.bincount
+TEAM_TYPES: List[TeamType] = list(TeamType)
+TEAM_TYPE_CODES: Dict[TeamType, int] = {team_type: code for code, team_type in enumerate(TEAM_TYPES)}
+
+# One bit per capability so capability sets compare with a single AND
+CAP_BIT: Dict[AgentCapability, int] = {cap: 1 << i for i, cap in enumerate(AgentCapability)}
+
+
+def capability_mask(capabilities) -> int:
+    """Encode an iterable of capabilities as a bitmask over CAP_BIT."""
+    mask = 0
+    for cap in capabilities:
+        mask |= CAP_BIT[cap]
+    return mask
+
+
+def ordered_capabilities(capabilities) -> List[AgentCapability]:
+    """Capabilities of a set in AgentCapability declaration order, for stable output."""
+    return [cap for cap in AgentCapability if cap in capabilities]
+
+
+def encode_json(obj: Any) -> str:
+    """Encode a JSON column value, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+NS_PER_HOUR = 3600 * NS_PER_SECOND
+
+
+# Workload types each capability is suited to
+CAPABILITY_WORKLOADS: Dict[AgentCapability, Tuple[WorkloadType, ...]] = {
+    AgentCapability.FRONTEND_DEV: (WorkloadType.CREATIVE, WorkloadType.IO_BOUND),
+    AgentCapability.BACKEND_DEV: (WorkloadType.CPU_INTENSIVE, WorkloadType.ANALYTICAL),
+    AgentCapability.DATABASE_OPS: (WorkloadType.IO_BOUND, WorkloadType.MEMORY_INTENSIVE),
+    AgentCapability.TESTING: (WorkloadType.ANALYTICAL, WorkloadType.CPU_INTENSIVE),
+    AgentCapability.DOCUMENTATION: (WorkloadType.CREATIVE, WorkloadType.IO_BOUND),
+    AgentCapability.DEVOPS: (WorkloadType.COORDINATION_HEAVY, WorkloadType.ANALYTICAL),
+    AgentCapability.SECURITY: (WorkloadType.ANALYTICAL, WorkloadType.CPU_INTENSIVE),
+    AgentCapability.PERFORMANCE: (WorkloadType.CPU_INTENSIVE, WorkloadType.MEMORY_INTENSIVE),
+    AgentCapability.COORDINATION: (WorkloadType.COORDINATION_HEAVY,),
+    AgentCapability.ANALYSIS: (WorkloadType.ANALYTICAL, WorkloadType.MEMORY_INTENSIVE)
+}
+
+
+@lru_cache(maxsize=256)
+def _infer_specializations_cached(capabilities: frozenset) -> Dict[WorkloadType, float]:
+    """Workload specialization scores for a capability set; treat as read-only."""
+    # Every workload type starts at the base score
+    specializations = dict.fromkeys(WorkloadType, 0.2)
+
+    # Increase scores based on capabilities
+    for capability in capabilities:
+        for workload_type in CAPABILITY_WORKLOADS.get(capability, ()):
+            specializations[workload_type] = min(0.9, specializations[workload_type] + 0.3)
+
+    return specializations
+
+
+# Dashboard symbols
+HEALTH_EMOJI: Dict[HealthLevel, str] = {
+    HealthLevel.HEALTHY: "🟢",
+    HealthLevel.DEGRADED: "🟡",
+    HealthLevel.STRUGGLING: "🟠",
+    HealthLevel.CRITICAL: "🔴",
+    HealthLevel.OFFLINE: "⚫"
+}
+LOAD_BAR_LENGTH = 8
+LOAD_BARS: List[str] = ["█" * filled + "░" * (LOAD_BAR_LENGTH - filled)
+                        for filled in range(LOAD_BAR_LENGTH + 1)]
+TEAM_TYPE_EMOJI: Dict[TeamType, str] = {
+    TeamType.PARALLEL: "⚡",
+    TeamType.PIPELINE: "🔄",
+    TeamType.MESH: "🕸️",
+    TeamType.SPECIALIST: "🎯",
+    TeamType.EMERGENCY: "🚨"
+}
+
+# Metrics sampled into each agent's performance history ring
+PERFORMANCE_METRICS: Tuple[str, ...] = ('performance', 'load', 'collaboration')
+PERFORMANCE_HISTORY_SAMPLES = 256
+
+
+# Integer health codes for the vectorized agent arrays, ordered by severity
+HEALTH_CODES: Dict[HealthLevel, int] = {level: code for code, level in enumerate(HealthLevel)}
+CRITICAL_HEALTH_CODE = HEALTH_CODES[HealthLevel.CRITICAL]
+OFFLINE_HEALTH_CODE = HEALTH_CODES[HealthLevel.OFFLINE]
+
+
+@dataclass(slots=True)
 class AgentProfile:
     """Comprehensive agent profile for optimal task assignment."""
     agent_name: str
-    capabilities: List[AgentCapability]
+    capabilities: FrozenSet[AgentCapability]
     performance_rating: float  # 0.0 - 1.0 based on historical performance
     current_load: float       # 0.0 - 1.0 current workload
     health_status: HealthLevel
@@ -83,17 +193,27 @@ class AgentProfile:
     collaboration_rating: float  # How well they work in teams
     availability_window: Optional[Tuple[str, str]]  # Time window when available
 
+    def __post_init__(self):
+        # Capabilities are held as a frozenset for O(1) membership tests
+        self.capabilities = frozenset(self.capabilities)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = asdict(self)
-        result['capabilities'] = [cap.value for cap in self.capabilities]
-        result['health_status'] = self.health_status.value
-        result['team_preferences'] = [pref.value for pref in self.team_preferences]
-        result['specialization_score'] = {k.value: v for k, v in self.specialization_score.items()}
-        return result
+        return {
+            'agent_name': self.agent_name,
+            'capabilities': [cap.value for cap in ordered_capabilities(self.capabilities)],
+            'performance_rating': self.performance_rating,
+            'current_load': self.current_load,
+            'health_status': self.health_status.value,
+            'team_preferences': [pref.value for pref in self.team_preferences],
+            'last_active': self.last_active,
+            'specialization_score': {k.value: v for k, v in self.specialization_score.items()},
+            'collaboration_rating': self.collaboration_rating,
+            'availability_window': self.availability_window
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Represents a coordinated team of agents."""
     team_id: str
@@ -109,13 +229,21 @@ class Team:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = asdict(self)
-        result['team_type'] = self.team_type.value
-        result['target_capability'] = [cap.value for cap in self.target_capability]
-        return result
+        return {
+            'team_id': self.team_id,
+            'team_type': self.team_type.value,
+            'leader_agent': self.leader_agent,
+            'member_agents': list(self.member_agents),
+            'assigned_workload': list(self.assigned_workload),
+            'target_capability': [cap.value for cap in self.target_capability],
+            'estimated_completion': self.estimated_completion,
+            'performance_metrics': dict(self.performance_metrics),
+            'coordination_overhead': self.coordination_overhead,
+            'created_at': self.created_at
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkDistributionPlan:
     """Plan for distributing work across agent teams."""
     plan_id: str
@@ -127,6 +255,157 @@ class WorkDistributionPlan:
     coordination_complexity: float  # 0.0 - 1.0, coordination overhead
     created_at: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'plan_id': self.plan_id,
+            'total_workload': list(self.total_workload),
+            'team_assignments': {team_id: list(items)
+                                 for team_id, items in self.team_assignments.items()},
+            'estimated_completion': self.estimated_completion,
+            'load_balance_score': self.load_balance_score,
+            'conflict_risk_score': self.conflict_risk_score,
+            'coordination_complexity': self.coordination_complexity,
+            'created_at': self.created_at
+        }
+
+
+class _SqlitePool:
+    """
+    Thread-local pool of long-lived SQLite connections.
+
+    Each thread lazily opens one connection and keeps it for its lifetime, so
+    the schema is parsed once per thread instead of once per statement.
+    Connections run in autocommit mode; callers group writes with an explicit
+    BEGIN/COMMIT when they need a transaction.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            # page_size only takes effect on a new database, before WAL is enabled
+            conn.execute("PRAGMA page_size=8192")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._local.conn = conn
+            self._local.cursors = {}
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def cursor(self, sql: str) -> sqlite3.Cursor:
+        """
+        Return this thread's cursor for a write statement, keyed by its SQL.
+
+        The connection's statement cache already holds the compiled statement
+        for each SQL string; reusing one cursor per statement also avoids
+        allocating a fresh cursor on every write. Only use it for statements
+        whose results are not iterated.
+        """
+        self.connection()
+        cursors = self._local.cursors
+        cursor = cursors.get(sql)
+        if cursor is None:
+            cursor = cursors[sql] = self._local.conn.cursor()
+        return cursor
+
+    def execute(self, sql: str, parameters: Tuple = ()) -> None:
+        """Run a write statement on this thread's cached cursor."""
+        self.cursor(sql).execute(sql, parameters)
+
+    def executemany(self, sql: str, rows: List[Tuple]) -> None:
+        """Run a write statement for every row on this thread's cached cursor."""
+        self.cursor(sql).executemany(sql, rows)
+
+    def close_all(self) -> None:
+        """Close every pooled connection; threads reopen lazily on next use."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+# The write-behind helpers below take the queue and pool rather than the
+# coordinator, so neither the writer thread nor the exit hook keeps it alive
+
+def _encode_row(row: Tuple, json_columns: int) -> Tuple:
+    """JSON-encode the last json_columns values of a queued row snapshot."""
+    if not json_columns:
+        return row
+    return row[:-json_columns] + tuple(
+        None if value is None else encode_json(value) for value in row[-json_columns:])
+
+
+def _flush_write_queue(write_queue: deque, pool: _SqlitePool, flush_lock: threading.Lock) -> None:
+    """
+    Write every queued row in one transaction.
+
+    Runs of the same statement go through a single executemany; queue order
+    is kept, so later writes to a row still win. If the write fails the rows
+    go back to the front of the queue for the next flush.
+    """
+    with flush_lock:
+        batch = []
+        while write_queue:
+            batch.append(write_queue.popleft())
+        if not batch:
+            return
+        try:
+            conn = pool.connection()
+            conn.execute("BEGIN")
+            try:
+                for (sql, json_columns), group in groupby(batch, key=itemgetter(0, 1)):
+                    pool.executemany(sql, [_encode_row(row, json_columns) for _, _, row in group])
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        except BaseException:
+            write_queue.extendleft(reversed(batch))
+            raise
+
+
+def _run_writer(coordinator_ref: weakref.ref, stop: threading.Event, interval: float) -> None:
+    """Flush the coordinator's writes every interval until stopped or collected."""
+    while not stop.wait(interval):
+        coordinator = coordinator_ref()
+        if coordinator is None:
+            return
+        try:
+            coordinator.flush_writes()
+        except Exception as e:
+            coordinator.logger.error(f"Error flushing swarm coordinator writes: {e}")
+        del coordinator
+
+
+def _flush_at_exit(write_queue: deque, pool: _SqlitePool, flush_lock: threading.Lock,
+                   stop: threading.Event) -> None:
+    """Finalizer: stop the writer and write what is still queued."""
+    stop.set()
+    try:
+        _flush_write_queue(write_queue, pool, flush_lock)
+    except Exception as e:
+        logging.getLogger(__name__).error(
+            f"Dropped {len(write_queue)} queued swarm coordinator writes: {e}")
+    pool.close_all()
+
 
 class SwarmCoordinator:
     """
@@ -168,19 +447,56 @@ class SwarmCoordinator:
             'workload_distribution': 120  # Redistribute work every 2 minutes
         }
 
+        # Per-thread persistent database connections and deferred write batch
+        self._db_pool = _SqlitePool(self.db_path)
+        self._write_batch = threading.local()
+
+        # Write-behind queue of (sql, json_columns, row) drained by one writer thread
+        self._write_queue: deque = deque()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stop = threading.Event()
+        self._writer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Writes still queued when the coordinator is collected, or at
+        # interpreter exit, are flushed here; close() is the explicit route
+        self._finalizer = weakref.finalize(
+            self, _flush_at_exit, self._write_queue, self._db_pool, self._flush_lock, self._writer_stop)
+
+        # Per-thread clock reading shared by everything in one coordination tick
+        self._tick = threading.local()
+
         # Thread-safe coordination state
         self._lock = threading.RLock()
         self._coordination_active = False
-        self._coordination_threads: Dict[str, threading.Thread] = {}
+        self._coordination_thread: Optional[threading.Thread] = None
+        self._coordination_stop = threading.Event()
+        self._scheduler: Optional[sched.scheduler] = None
+        self._scheduler_wakeup = threading.Event()
+        self._scheduled_ticks: Dict[str, sched.Event] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # In-memory coordination state
         self._agent_profiles: Dict[str, AgentProfile] = {}
+
+        # Struct-of-arrays mirror of the scoring fields in _agent_profiles;
+        # row i describes self._agent_names[i]. The 0..1 ratings are kept as
+        # float32, ample precision for ranking and threshold checks.
+        self._agent_names: List[str] = []
+        self._agent_rows: Dict[str, int] = {}
+        capacity = max(max_agents, 1)
+        self._perf = np.zeros(capacity, dtype=np.float32)
+        self._load = np.zeros(capacity, dtype=np.float32)
+        self._collab = np.zeros(capacity, dtype=np.float32)
+        self._health = np.zeros(capacity, dtype=np.int8)
+        self._caps_mask = np.zeros(capacity, dtype=np.uint32)
         self._active_teams: Dict[str, Team] = {}
+        self._team_id_counter = itertools.count()
         self._work_queue: deque = deque()
         self._conflict_registry: Dict[str, Dict[str, Any]] = {}
 
-        # Performance tracking
-        self._performance_history: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # Performance tracking: per agent, a fixed-size ring of samples with
+        # one row per PERFORMANCE_METRICS entry, plus the count of samples taken
+        self._performance_history: Dict[str, Tuple[np.ndarray, int]] = {}
         self._team_formation_algorithms: Dict[TeamType, Callable] = {}
 
         # Initialize components
@@ -211,7 +527,7 @@ class SwarmCoordinator:
                     collaboration_rating REAL NOT NULL DEFAULT 0.5,
                     availability_window TEXT,
                     updated_at REAL NOT NULL DEFAULT (julianday('now'))
-                )
+                ) WITHOUT ROWID
             """)
 
             # Teams table
@@ -228,7 +544,7 @@ class SwarmCoordinator:
                     coordination_overhead REAL NOT NULL DEFAULT 0.1,
                     created_at TEXT NOT NULL,
                     updated_at REAL NOT NULL DEFAULT (julianday('now'))
-                )
+                ) WITHOUT ROWID
             """)
 
             # Work distribution plans table
@@ -243,7 +559,7 @@ class SwarmCoordinator:
                     coordination_complexity REAL NOT NULL,
                     created_at TEXT NOT NULL,
                     updated_at REAL NOT NULL DEFAULT (julianday('now'))
-                )
+                ) WITHOUT ROWID
             """)
 
             # Conflict registry table
@@ -259,7 +575,7 @@ class SwarmCoordinator:
                     created_at TEXT NOT NULL,
                     resolved_at TEXT,
                     updated_at REAL NOT NULL DEFAULT (julianday('now'))
-                )
+                ) WITHOUT ROWID
             """)
 
             # Performance history table
@@ -279,10 +595,18 @@ class SwarmCoordinator:
                 CREATE INDEX IF NOT EXISTS idx_agent_profiles_health
                 ON agent_profiles(health_status, current_load)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_agent_profiles_load
+                ON agent_profiles(current_load)
+            """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_teams_type_status
                 ON teams(team_type, updated_at DESC)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_teams_leader
+                ON teams(leader_agent, team_type)
+            """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_conflicts_status
                 ON conflict_registry(status, created_at DESC)
@@ -305,43 +629,41 @@ class SwarmCoordinator:
 
     @contextmanager
     def _get_db_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(
-            str(self.db_path),
-            timeout=30.0,
-            check_same_thread=False
-        )
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Context manager yielding this thread's pooled database connection."""
+        yield self._db_pool.connection()
 
     def start_coordination(self) -> None:
-        """Start all coordination loops in background threads."""
+        """Start all coordination loops on one scheduler thread and a small worker pool."""
         with self._lock:
             if self._coordination_active:
                 self.logger.warning("Coordination already active")
                 return
 
-            self._coordination_active = True
+            # Scheduling machinery is only needed once the loops run
+            import sched
+            from concurrent.futures import ThreadPoolExecutor
 
-            # Start coordination threads
-            coordination_tasks = {
-                'team_rebalancing': self._team_rebalancing_loop,
-                'conflict_detection': self._conflict_detection_loop,
-                'performance_assessment': self._performance_assessment_loop,
-                'workload_distribution': self._workload_distribution_loop
-            }
-
-            for task_name, task_func in coordination_tasks.items():
-                thread = threading.Thread(
-                    target=task_func,
-                    name=f"swarm_coordinator_{task_name}",
-                    daemon=True
-                )
-                thread.start()
-                self._coordination_threads[task_name] = thread
+            self._coordination_active = True
+            self._coordination_stop.clear()
+
+            # One min-heap of next-run times decides what is due; the ticks
+            # themselves run on two workers so slow SQLite writes don't delay it
+            self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="swarm_coordinator")
+            for interval_name, tick in (
+                ('team_rebalancing', self._team_rebalancing_tick),
+                ('conflict_detection', self._conflict_detection_tick),
+                ('performance_assessment', self._performance_assessment_tick),
+                ('workload_distribution', self._workload_distribution_tick),
+            ):
+                self._scheduler.enter(0, 1, self._dispatch_tick, (interval_name, tick, None))
+
+            self._coordination_thread = threading.Thread(
+                target=self._run_scheduler,
+                name="swarm_coordinator_scheduler",
+                daemon=True
+            )
+            self._coordination_thread.start()
 
             self.logger.info("Swarm coordination started")
 
@@ -352,13 +674,33 @@ class SwarmCoordinator:
                 return
 
             self._coordination_active = False
-
-            # Wait for threads to finish
-            for thread in self._coordination_threads.values():
-                thread.join(timeout=5.0)
-
-            self._coordination_threads.clear()
-            self.logger.info("Swarm coordination stopped")
+            self._coordination_stop.set()
+            self._scheduler_wakeup.set()
+            thread, self._coordination_thread = self._coordination_thread, None
+            executor, self._executor = self._executor, None
+
+        # Join outside the lock: in-flight ticks may still need it to finish
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._scheduler = None
+        self._scheduled_ticks.clear()
+
+        self._stop_writer()
+        self._db_pool.close_all()
+        self.logger.info("Swarm coordination stopped")
+
+    def close(self) -> None:
+        """
+        Stop coordination, write everything still queued and close the
+        database connections. Call before removing the database; raises if
+        the queued writes cannot be written.
+        """
+        self.stop_coordination()
+        self._stop_writer()
+        self.flush_writes()
+        self._db_pool.close_all()
 
     def register_agent(self,
                       agent_name: str,
@@ -377,8 +719,54 @@ class SwarmCoordinator:
         Returns:
             Created agent profile
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        profile = self._new_agent_profile(agent_name, capabilities, specializations,
+                                          team_preferences, self._now_iso())
 
+        with self._lock:
+            self._agent_profiles[agent_name] = profile
+            self._sync_agent_arrays(profile)
+            self._persist_agent_profile(profile)
+
+        self.logger.info(f"Registered agent {agent_name} with capabilities: {[c.value for c in capabilities]}")
+        return profile
+
+    def register_agents(self, profiles: List[AgentProfile]) -> List[AgentProfile]:
+        """
+        Register several agents at once, as register_agent does for each.
+
+        Only the name, capabilities, specializations and team preferences of
+        each given profile are used; ratings, load and health start from the
+        same defaults as register_agent. Rows are persisted as one batch.
+
+        Args:
+            profiles: Agent profiles to register
+
+        Returns:
+            The registered profiles
+        """
+        timestamp = self._now_iso()
+        profiles = [
+            self._new_agent_profile(profile.agent_name, profile.capabilities,
+                                    profile.specialization_score, profile.team_preferences,
+                                    timestamp)
+            for profile in profiles
+        ]
+        with self._lock, self._batched_persistence():
+            for profile in profiles:
+                self._agent_profiles[profile.agent_name] = profile
+                self._sync_agent_arrays(profile)
+                self._persist_agent_profile(profile)
+
+        self.logger.info(f"Registered {len(profiles)} agents")
+        return profiles
+
+    def _new_agent_profile(self,
+                           agent_name: str,
+                           capabilities: List[AgentCapability],
+                           specializations: Optional[Dict[WorkloadType, float]],
+                           team_preferences: Optional[List[TeamType]],
+                           timestamp: str) -> AgentProfile:
+        """Build a newly registered agent's profile with neutral starting ratings."""
         # Default specializations based on capabilities
         if specializations is None:
             specializations = self._infer_specializations(capabilities)
@@ -394,7 +782,7 @@ class SwarmCoordinator:
             if agent_metrics:
                 health_status = agent_metrics.health_level
 
-        profile = AgentProfile(
+        return AgentProfile(
             agent_name=agent_name,
             capabilities=capabilities,
             performance_rating=0.5,  # Start with neutral rating
@@ -407,11 +795,44 @@ class SwarmCoordinator:
             availability_window=None
         )
 
-        self._agent_profiles[agent_name] = profile
-        self._persist_agent_profile(profile)
+    def update_agent_metrics(self,
+                             agent_name: str,
+                             performance_rating: Optional[float] = None,
+                             current_load: Optional[float] = None,
+                             health_status: Optional[HealthLevel] = None,
+                             collaboration_rating: Optional[float] = None) -> AgentProfile:
+        """
+        Update the scoring fields of a registered agent.
 
-        self.logger.info(f"Registered agent {agent_name} with capabilities: {[c.value for c in capabilities]}")
-        return profile
+        Profiles are mirrored into the vectorized scoring arrays, so changes
+        to these fields must go through this method to stay visible to team
+        formation.
+
+        Args:
+            agent_name: Registered agent identifier
+            performance_rating: New performance rating (0.0-1.0)
+            current_load: New workload (0.0-1.0)
+            health_status: New health level
+            collaboration_rating: New collaboration rating (0.0-1.0)
+
+        Returns:
+            Updated agent profile
+        """
+        with self._lock:
+            profile = self._agent_profiles[agent_name]
+            if performance_rating is not None:
+                self._shift_team_performance(agent_name, performance_rating - profile.performance_rating)
+                profile.performance_rating = performance_rating
+            if current_load is not None:
+                profile.current_load = current_load
+            if health_status is not None:
+                profile.health_status = health_status
+            if collaboration_rating is not None:
+                profile.collaboration_rating = collaboration_rating
+
+            self._sync_agent_arrays(profile)
+            self._persist_agent_profile(profile)
+            return profile
 
     def form_team(self,
                   workload: List[str],
@@ -430,7 +851,7 @@ class SwarmCoordinator:
         Returns:
             Formed team or None if unable to form suitable team
         """
-        with self._lock:
+        with self._lock, self._coordination_tick():
             # Use appropriate team formation algorithm
             if team_type in self._team_formation_algorithms:
                 algorithm = self._team_formation_algorithms[team_type]
@@ -439,6 +860,18 @@ class SwarmCoordinator:
                 # Default to parallel team formation
                 return self._form_parallel_team(workload, required_capabilities, preferred_agents)
 
+    def queue_work(self, work_items: List[str]) -> None:
+        """
+        Queue work items for the workload distribution loop.
+
+        The loop is woken immediately rather than at the end of its interval.
+
+        Args:
+            work_items: List of work items to distribute
+        """
+        self._work_queue.extend(work_items)
+        self._wake_tick('workload_distribution')
+
     def distribute_work(self, work_items: List[str]) -> WorkDistributionPlan:
         """
         Create an optimal work distribution plan across active teams.
@@ -449,40 +882,42 @@ class SwarmCoordinator:
         Returns:
             Work distribution plan
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
-        plan_id = f"distribution_{int(time.time())}"
-
-        # Analyze work characteristics
-        work_analysis = self._analyze_workload(work_items)
-
-        # Get available teams and their capabilities
-        available_teams = self._get_available_teams()
-
-        # Create distribution plan using optimization algorithm
-        team_assignments = self._optimize_work_distribution(work_items, available_teams, work_analysis)
-
-        # Calculate plan metrics
-        load_balance_score = self._calculate_load_balance(team_assignments)
-        conflict_risk_score = self._assess_conflict_risk(team_assignments)
-        coordination_complexity = self._calculate_coordination_complexity(team_assignments)
-
-        # Estimate completion time
-        estimated_completion = self._estimate_completion_time(team_assignments)
-
-        plan = WorkDistributionPlan(
-            plan_id=plan_id,
-            total_workload=work_items,
-            team_assignments=team_assignments,
-            estimated_completion=estimated_completion,
-            load_balance_score=load_balance_score,
-            conflict_risk_score=conflict_risk_score,
-            coordination_complexity=coordination_complexity,
-            created_at=timestamp
-        )
-
-        self._persist_distribution_plan(plan)
-        self.logger.info(f"Created work distribution plan {plan_id} for {len(work_items)} items")
-        return plan
+        with self._coordination_tick():
+            timestamp = self._now_iso()
+            plan_id = f"distribution_{self._now_ns() // NS_PER_SECOND}"
+
+            # Analyze work characteristics
+            work_analysis = self._analyze_workload(work_items)
+
+            # Get available teams and their capabilities
+            # Each item goes to one team, so more teams than items cannot help
+            available_teams = self._get_available_teams(k=min(len(work_items), 32))
+
+            # Create distribution plan using optimization algorithm
+            team_assignments = self._optimize_work_distribution(work_items, available_teams, work_analysis)
+
+            # Calculate plan metrics
+            load_balance_score = self._calculate_load_balance(team_assignments)
+            conflict_risk_score = self._assess_conflict_risk(team_assignments)
+            coordination_complexity = self._calculate_coordination_complexity(team_assignments)
+
+            # Estimate completion time
+            estimated_completion = self._estimate_completion_time(team_assignments)
+
+            plan = WorkDistributionPlan(
+                plan_id=plan_id,
+                total_workload=work_items,
+                team_assignments=team_assignments,
+                estimated_completion=estimated_completion,
+                load_balance_score=load_balance_score,
+                conflict_risk_score=conflict_risk_score,
+                coordination_complexity=coordination_complexity,
+                created_at=timestamp
+            )
+
+            self._persist_distribution_plan(plan)
+            self.logger.info(f"Created work distribution plan {plan_id} for {len(work_items)} items")
+            return plan
 
     def detect_conflicts(self) -> List[Dict[str, Any]]:
         """
@@ -491,25 +926,21 @@ class SwarmCoordinator:
         Returns:
             List of detected conflicts
         """
-        conflicts = []
-
-        # Check for resource conflicts
-        resource_conflicts = self._detect_resource_conflicts()
-        conflicts.extend(resource_conflicts)
-
-        # Check for coordination conflicts
-        coordination_conflicts = self._detect_coordination_conflicts()
-        conflicts.extend(coordination_conflicts)
-
-        # Check for performance conflicts
-        performance_conflicts = self._detect_performance_conflicts()
-        conflicts.extend(performance_conflicts)
+        with self._coordination_tick():
+            conflicts = [
+                *self._detect_resource_conflicts(),
+                *self._detect_coordination_conflicts(),
+                *self._detect_performance_conflicts(),
+            ]
 
-        # Persist new conflicts
-        for conflict in conflicts:
-            if conflict['conflict_id'] not in self._conflict_registry:
-                self._conflict_registry[conflict['conflict_id']] = conflict
-                self._persist_conflict(conflict)
+            # Register and persist the new conflicts in one pass and one write
+            new_conflicts = []
+            for conflict in conflicts:
+                conflict_id = conflict['conflict_id']
+                if conflict_id not in self._conflict_registry:
+                    self._conflict_registry[conflict_id] = conflict
+                    new_conflicts.append(conflict)
+            self._persist_conflicts_bulk(new_conflicts)
 
         return conflicts
 
@@ -545,7 +976,7 @@ class SwarmCoordinator:
 
             if success:
                 conflict['status'] = 'resolved'
-                conflict['resolved_at'] = datetime.now(timezone.utc).isoformat()
+                conflict['resolved_at'] = self._now_iso()
                 self._update_conflict(conflict)
                 self.logger.info(f"Resolved conflict {conflict_id} using {resolution_strategy}")
 
@@ -557,89 +988,100 @@ class SwarmCoordinator:
 
     def get_swarm_status(self) -> Dict[str, Any]:
         """Get comprehensive status of the swarm coordination system."""
+        # Snapshot under the lock, aggregate outside it so mutators and the
+        # coordination loops are not blocked by status reads
         with self._lock:
-            # Calculate swarm metrics
-            total_agents = len(self._agent_profiles)
-            healthy_agents = sum(1 for profile in self._agent_profiles.values()
-                               if profile.health_status == HealthLevel.HEALTHY)
-            total_teams = len(self._active_teams)
-            active_conflicts = len([c for c in self._conflict_registry.values()
-                                  if c['status'] == 'active'])
-
-            # Calculate utilization
-            total_capacity = sum(1.0 - profile.current_load for profile in self._agent_profiles.values())
-            avg_utilization = 1.0 - (total_capacity / max(total_agents, 1))
-
-            # Team distribution
-            team_distribution = defaultdict(int)
-            for team in self._active_teams.values():
-                team_distribution[team.team_type] += 1
-
-            return {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "coordination_active": self._coordination_active,
-                "swarm_metrics": {
-                    "total_agents": total_agents,
-                    "healthy_agents": healthy_agents,
-                    "agent_health_ratio": healthy_agents / max(total_agents, 1),
-                    "total_teams": total_teams,
-                    "average_utilization": avg_utilization,
-                    "active_conflicts": active_conflicts
-                },
-                "team_distribution": dict(team_distribution),
-                "work_queue_size": len(self._work_queue),
-                "performance_trends": self._get_performance_trends()
-            }
+            total_agents = len(self._agent_names)
+            health = self._health[:total_agents].copy()
+            load = self._load[:total_agents].copy()
+            team_types = np.fromiter((TEAM_TYPE_CODES[team.team_type]
+                                      for team in self._active_teams.values()),
+                                     dtype=np.int8, count=len(self._active_teams))
+            conflicts = list(self._conflict_registry.values())
+            coordination_active = self._coordination_active
+            work_queue_size = len(self._work_queue)
+
+        # Calculate swarm metrics
+        healthy_agents = int(np.count_nonzero(health == HEALTH_CODES[HealthLevel.HEALTHY]))
+        total_teams = len(team_types)
+        active_conflicts = sum(1 for c in conflicts if c['status'] == 'active')
+
+        # Calculate utilization
+        total_capacity = float(total_agents - load.sum(dtype=np.float64))
+        avg_utilization = 1.0 - (total_capacity / max(total_agents, 1))
+
+        # Team distribution
+        team_counts = np.bincount(team_types, minlength=len(TEAM_TYPES))
+        team_distribution = {TEAM_TYPES[code]: int(count)
+                             for code, count in enumerate(team_counts) if count}
+
+        return {
+            "timestamp": self._now_iso(),
+            "coordination_active": coordination_active,
+            "swarm_metrics": {
+                "total_agents": total_agents,
+                "healthy_agents": healthy_agents,
+                "agent_health_ratio": healthy_agents / max(total_agents, 1),
+                "total_teams": total_teams,
+                "average_utilization": avg_utilization,
+                "active_conflicts": active_conflicts
+            },
+            "team_distribution": team_distribution,
+            "work_queue_size": work_queue_size,
+            "performance_trends": self._get_performance_trends()
+        }
 
     def generate_coordination_dashboard(self) -> str:
         """Generate real-time swarm coordination dashboard."""
-        with self._lock:
-            dashboard = []
-            dashboard.append("🎯 SWARM COORDINATION DASHBOARD - Phase C Intelligence")
-            dashboard.append("=" * 70)
-            dashboard.append("")
-
-            status = self.get_swarm_status()
+        status = self.get_swarm_status()
 
-            # Swarm overview
-            dashboard.append("SWARM OVERVIEW:")
-            metrics = status["swarm_metrics"]
-            dashboard.append(f"  Agents: {metrics['total_agents']}/{self.max_agents} "
-                           f"({metrics['healthy_agents']} healthy)")
-            dashboard.append(f"  Teams: {metrics['total_teams']} active")
-            dashboard.append(f"  Utilization: {metrics['average_utilization']:.1%}")
-            dashboard.append(f"  Conflicts: {metrics['active_conflicts']} active")
+        # Only the rows shown are copied under the lock; rendering happens outside
+        with self._lock:
+            agent_rows = list(islice(self._agent_profiles.items(), 10))  # Show top 10
+            team_rows = list(islice(self._active_teams.items(), 5))  # Show top 5
+
+        dashboard = []
+        dashboard.append("🎯 SWARM COORDINATION DASHBOARD - Phase C Intelligence")
+        dashboard.append("=" * 70)
+        dashboard.append("")
+
+        # Swarm overview
+        dashboard.append("SWARM OVERVIEW:")
+        metrics = status["swarm_metrics"]
+        dashboard.append(f"  Agents: {metrics['total_agents']}/{self.max_agents} "
+                         f"({metrics['healthy_agents']} healthy)")
+        dashboard.append(f"  Teams: {metrics['total_teams']} active")
+        dashboard.append(f"  Utilization: {metrics['average_utilization']:.1%}")
+        dashboard.append(f"  Conflicts: {metrics['active_conflicts']} active")
+        dashboard.append("")
+
+        # Team distribution
+        if status["team_distribution"]:
+            dashboard.append("TEAM DISTRIBUTION:")
+            for team_type, count in status["team_distribution"].items():
+                dashboard.append(f"  {team_type.replace('_', ' ').title()}: {count} teams")
             dashboard.append("")
 
-            # Team distribution
-            if status["team_distribution"]:
-                dashboard.append("TEAM DISTRIBUTION:")
-                for team_type, count in status["team_distribution"].items():
-                    dashboard.append(f"  {team_type.replace('_', ' ').title()}: {count} teams")
-                dashboard.append("")
-
-            # Agent health status
-            dashboard.append("AGENT STATUS:")
-            for agent_name, profile in list(self._agent_profiles.items())[:10]:  # Show top 10
-                health_emoji = self._get_health_emoji(profile.health_status)
-                load_bar = self._get_load_bar(profile.current_load)
-                caps = len(profile.capabilities)
-                dashboard.append(f"  {health_emoji} {agent_name:<12} │ {load_bar} │ {caps} capabilities")
+        # Agent health status
+        dashboard.append("AGENT STATUS:")
+        for agent_name, profile in agent_rows:
+            health_emoji = HEALTH_EMOJI.get(profile.health_status, "❓")
+            load_bar = self._get_load_bar(profile.current_load)
+            caps = len(profile.capabilities)
+            dashboard.append(f"  {health_emoji} {agent_name:<12} │ {load_bar} │ {caps} capabilities")
+        dashboard.append("")
+
+        # Active teams
+        if team_rows:
+            dashboard.append("ACTIVE TEAMS:")
+            for team_id, team in team_rows:
+                emoji = TEAM_TYPE_EMOJI.get(team.team_type, "👥")
+                member_count = len(team.member_agents)
+                workload_count = len(team.assigned_workload)
+                dashboard.append(f"  {emoji} {team_id:<12} │ {member_count} agents │ {workload_count} tasks")
             dashboard.append("")
 
-            # Active teams
-            if self._active_teams:
-                dashboard.append("ACTIVE TEAMS:")
-                for team_id, team in list(self._active_teams.items())[:5]:  # Show top 5
-                    team_type_emoji = {"parallel": "⚡", "pipeline": "🔄", "mesh": "🕸️",
-                                     "specialist": "🎯", "emergency": "🚨"}
-                    emoji = team_type_emoji.get(team.team_type.value, "👥")
-                    member_count = len(team.member_agents)
-                    workload_count = len(team.assigned_workload)
-                    dashboard.append(f"  {emoji} {team_id:<12} │ {member_count} agents │ {workload_count} tasks")
-                dashboard.append("")
-
-            return "\n".join(dashboard)
+        return "\n".join(dashboard)
 
     # Team formation algorithms
     def _register_team_formation_algorithms(self) -> None:
@@ -655,10 +1097,11 @@ class SwarmCoordinator:
     def _form_parallel_team(self, workload: List[str], capabilities: List[AgentCapability],
                            preferred_agents: List[str] = None) -> Optional[Team]:
         """Form a parallel work team."""
-        # Get available agents
-        available_agents = self._get_available_agents(capabilities, preferred_agents)
+        # Rank straight off the availability mask without materializing the
+        # name of every available agent
+        rows = self._available_rows(capabilities, preferred_agents)
 
-        if len(available_agents) < self.min_team_size:
+        if len(rows) < self.min_team_size:
             self.logger.warning("Not enough available agents for parallel team")
             return None
 
@@ -666,26 +1109,27 @@ class SwarmCoordinator:
         optimal_size = min(self.max_team_size, max(self.min_team_size,
                           len(workload) // 2 + 1))
 
-        # Sort by performance and availability
-        sorted_agents = sorted(available_agents,
-                             key=lambda a: (self._agent_profiles[a].performance_rating,
-                                          -self._agent_profiles[a].current_load),
-                             reverse=True)
+        # Top optimal_size by performance (desc), then current load (asc);
+        # keys are pulled from the agent arrays once, then heap-selected
+        keys = list(zip(self._perf[rows].tolist(), (-self._load[rows]).tolist()))
+        top = heapq.nlargest(optimal_size, range(len(rows)), key=keys.__getitem__)
 
-        selected_agents = sorted_agents[:optimal_size]
+        selected_agents = [self._agent_names[row] for row in rows[top].tolist()]
 
         # No leader needed for parallel teams - all agents work independently
+        avg_performance = self._average_performance(selected_agents)
         team = Team(
-            team_id=f"parallel_{int(time.time())}",
+            team_id=self._new_team_id("parallel"),
             team_type=TeamType.PARALLEL,
             leader_agent=None,
             member_agents=selected_agents,
             assigned_workload=workload,
             target_capability=capabilities,
-            estimated_completion=self._estimate_team_completion(selected_agents, workload),
-            performance_metrics={},
+            estimated_completion=self._estimate_team_completion(selected_agents, workload,
+                                                                avg_performance=avg_performance),
+            performance_metrics={'avg_performance': avg_performance},
             coordination_overhead=0.1,  # Low overhead for parallel work
-            created_at=datetime.now(timezone.utc).isoformat()
+            created_at=self._now_iso()
         )
 
         self._active_teams[team.team_id] = team
@@ -708,20 +1152,22 @@ class SwarmCoordinator:
                                                     min(self.max_team_size, len(workload)))
 
         # Select leader with highest coordination rating
-        leader = max(selected_agents,
-                    key=lambda a: self._agent_profiles[a].collaboration_rating)
+        collab = [self._agent_profiles[a].collaboration_rating for a in selected_agents]
+        leader = selected_agents[max(range(len(selected_agents)), key=collab.__getitem__)]
 
+        avg_performance = self._average_performance(selected_agents)
         team = Team(
-            team_id=f"pipeline_{int(time.time())}",
+            team_id=self._new_team_id("pipeline"),
             team_type=TeamType.PIPELINE,
             leader_agent=leader,
             member_agents=selected_agents,
             assigned_workload=workload,
             target_capability=capabilities,
-            estimated_completion=self._estimate_team_completion(selected_agents, workload),
-            performance_metrics={},
+            estimated_completion=self._estimate_team_completion(selected_agents, workload,
+                                                                avg_performance=avg_performance),
+            performance_metrics={'avg_performance': avg_performance},
             coordination_overhead=0.3,  # Higher overhead for sequential coordination
-            created_at=datetime.now(timezone.utc).isoformat()
+            created_at=self._now_iso()
         )
 
         self._active_teams[team.team_id] = team
@@ -735,34 +1181,38 @@ class SwarmCoordinator:
         """Form a mesh team for complex interdependent work."""
         available_agents = self._get_available_agents(capabilities, preferred_agents)
 
+        # Each profile is read once; sorts and selections below use these keys
+        profiles = [self._agent_profiles[a] for a in available_agents]
+        collab = [p.collaboration_rating for p in profiles]
+
         # Mesh teams need high collaboration agents
-        high_collab_agents = [a for a in available_agents
-                             if self._agent_profiles[a].collaboration_rating > 0.7]
+        high_collab = [i for i, rating in enumerate(collab) if rating > 0.7]
 
-        if len(high_collab_agents) < self.min_team_size:
+        if len(high_collab) < self.min_team_size:
             # Fall back to best available if not enough high-collaboration agents
-            high_collab_agents = sorted(available_agents,
-                                      key=lambda a: self._agent_profiles[a].collaboration_rating,
-                                      reverse=True)[:self.max_team_size]
+            high_collab = heapq.nlargest(self.max_team_size, range(len(available_agents)),
+                                         key=collab.__getitem__)
 
-        selected_agents = high_collab_agents[:min(self.max_team_size, len(high_collab_agents))]
+        selected = high_collab[:min(self.max_team_size, len(high_collab))]
+        selected_agents = [available_agents[i] for i in selected]
 
         # Select coordinator (not necessarily leader, more of a facilitator)
-        coordinator = max(selected_agents,
-                         key=lambda a: (self._agent_profiles[a].collaboration_rating +
-                                       self._agent_profiles[a].performance_rating) / 2)
+        coordinator = available_agents[max(
+            selected, key=lambda i: (collab[i] + profiles[i].performance_rating) / 2)]
 
+        avg_performance = self._average_performance(selected_agents)
         team = Team(
-            team_id=f"mesh_{int(time.time())}",
+            team_id=self._new_team_id("mesh"),
             team_type=TeamType.MESH,
             leader_agent=coordinator,
             member_agents=selected_agents,
             assigned_workload=workload,
             target_capability=capabilities,
-            estimated_completion=self._estimate_team_completion(selected_agents, workload),
-            performance_metrics={},
+            estimated_completion=self._estimate_team_completion(selected_agents, workload,
+                                                                avg_performance=avg_performance),
+            performance_metrics={'avg_performance': avg_performance},
             coordination_overhead=0.5,  # Highest overhead for complex coordination
-            created_at=datetime.now(timezone.utc).isoformat()
+            created_at=self._now_iso()
         )
 
         self._active_teams[team.team_id] = team
@@ -774,28 +1224,32 @@ class SwarmCoordinator:
     def _form_specialist_team(self, workload: List[str], capabilities: List[AgentCapability],
                              preferred_agents: List[str] = None) -> Optional[Team]:
         """Form a specialist team with domain experts."""
-        # Find agents with high specialization in required capabilities
+        # Find agents with high specialization in required capabilities:
+        # not critical, not too busy, high performing and holding at least one
+        # required capability, evaluated over all agents at once
+        candidates = (self._preferred_rows(preferred_agents) if preferred_agents
+                      else np.arange(len(self._agent_names)))
+        matched_caps = self._caps_mask[candidates] & capability_mask(capabilities)
+        keep = ((self._health[candidates] < CRITICAL_HEALTH_CODE)
+                & (self._load[candidates] <= 0.8)
+                & (self._perf[candidates] > 0.7)
+                & (matched_caps != 0))
+
         specialist_agents = []
-        for agent_name, profile in self._agent_profiles.items():
-            if preferred_agents and agent_name not in preferred_agents:
-                continue
-            if profile.health_status in [HealthLevel.CRITICAL, HealthLevel.OFFLINE]:
-                continue
-            if profile.current_load > 0.8:  # Too busy
-                continue
-
-            # Check if agent has required capabilities with high performance
-            capability_match = sum(1 for cap in capabilities if cap in profile.capabilities)
-            if capability_match > 0 and profile.performance_rating > 0.7:
-                specialist_agents.append((agent_name, capability_match, profile.performance_rating))
+        for row, caps in zip(candidates[keep].tolist(), matched_caps[keep].tolist()):
+            agent_name = self._agent_names[row]
+            capability_match = caps.bit_count()
+            specialist_agents.append((agent_name, capability_match,
+                                      self._agent_profiles[agent_name].performance_rating))
 
         if not specialist_agents:
             self.logger.warning("No specialist agents available for required capabilities")
             return None
 
-        # Sort by capability match and performance
-        specialist_agents.sort(key=lambda x: (x[1], x[2]), reverse=True)
-        selected_agents = [agent[0] for agent in specialist_agents[:self.max_team_size]]
+        # Best capability match and performance (keys already in the tuples);
+        # only a team's worth is kept, so large swarms skip the full sort
+        selected_agents = [agent[0] for agent in
+                           heapq.nlargest(self.max_team_size, specialist_agents, key=itemgetter(1, 2))]
 
         if len(selected_agents) < self.min_team_size:
             return None
@@ -803,17 +1257,19 @@ class SwarmCoordinator:
         # Most specialized agent becomes leader
         leader = selected_agents[0]
 
+        avg_performance = self._average_performance(selected_agents)
         team = Team(
-            team_id=f"specialist_{int(time.time())}",
+            team_id=self._new_team_id("specialist"),
             team_type=TeamType.SPECIALIST,
             leader_agent=leader,
             member_agents=selected_agents,
             assigned_workload=workload,
             target_capability=capabilities,
-            estimated_completion=self._estimate_team_completion(selected_agents, workload),
-            performance_metrics={},
+            estimated_completion=self._estimate_team_completion(selected_agents, workload,
+                                                                avg_performance=avg_performance),
+            performance_metrics={'avg_performance': avg_performance},
             coordination_overhead=0.2,  # Lower overhead due to expertise
-            created_at=datetime.now(timezone.utc).isoformat()
+            created_at=self._now_iso()
         )
 
         self._active_teams[team.team_id] = team
@@ -825,44 +1281,39 @@ class SwarmCoordinator:
     def _form_emergency_team(self, workload: List[str], capabilities: List[AgentCapability],
                             preferred_agents: List[str] = None) -> Optional[Team]:
         """Form an emergency response team for urgent work."""
-        # Get immediately available agents regardless of current load
-        available_agents = []
-        for agent_name, profile in self._agent_profiles.items():
-            if preferred_agents and agent_name not in preferred_agents:
-                continue
-            if profile.health_status == HealthLevel.OFFLINE:
-                continue
-            if profile.current_load < 0.9:  # Allow higher load for emergency
-                available_agents.append(agent_name)
-
-        if len(available_agents) < 2:  # Emergency teams can be smaller
+        # Get immediately available agents regardless of current load: any
+        # agent not offline and under 90% load, evaluated over all agents at once
+        candidates = (self._preferred_rows(preferred_agents) if preferred_agents
+                      else np.arange(len(self._agent_names)))
+        rows = candidates[(self._health[candidates] != OFFLINE_HEALTH_CODE)
+                          & (self._load[candidates] < 0.9)]
+
+        if len(rows) < 2:  # Emergency teams can be smaller
             self.logger.warning("Not enough agents available for emergency team")
             return None
 
-        # Select most responsive and capable agents
-        emergency_agents = sorted(available_agents,
-                                key=lambda a: (
-                                    self._agent_profiles[a].performance_rating,
-                                    -self._agent_profiles[a].current_load,
-                                    self._agent_profiles[a].collaboration_rating
-                                ), reverse=True)
-
-        selected_agents = emergency_agents[:min(5, len(emergency_agents))]  # Max 5 for emergency
+        # Select the most responsive and capable agents (max 5 for emergency):
+        # performance desc, then load asc, then collaboration desc. lexsort is
+        # stable, so ties keep registration order.
+        order = np.lexsort((-self._collab[rows], self._load[rows], -self._perf[rows]))[:5]
+        selected_agents = [self._agent_names[row] for row in rows[order].tolist()]
 
         # Highest performer leads
         leader = selected_agents[0]
 
+        avg_performance = self._average_performance(selected_agents)
         team = Team(
-            team_id=f"emergency_{int(time.time())}",
+            team_id=self._new_team_id("emergency"),
             team_type=TeamType.EMERGENCY,
             leader_agent=leader,
             member_agents=selected_agents,
             assigned_workload=workload,
             target_capability=capabilities,
-            estimated_completion=self._estimate_team_completion(selected_agents, workload, urgent=True),
-            performance_metrics={},
+            estimated_completion=self._estimate_team_completion(selected_agents, workload, urgent=True,
+                                                                avg_performance=avg_performance),
+            performance_metrics={'avg_performance': avg_performance},
             coordination_overhead=0.15,  # Low overhead for speed
-            created_at=datetime.now(timezone.utc).isoformat()
+            created_at=self._now_iso()
         )
 
         self._active_teams[team.team_id] = team
@@ -872,67 +1323,186 @@ class SwarmCoordinator:
         return team
 
     # Coordination loops
-    def _team_rebalancing_loop(self) -> None:
-        """Continuously rebalance teams for optimal performance."""
-        while self._coordination_active:
-            try:
-                self._rebalance_all_teams()
-            except Exception as e:
-                self.logger.error(f"Error in team rebalancing: {e}")
-            time.sleep(self.intervals['team_rebalancing'])
-
-    def _conflict_detection_loop(self) -> None:
-        """Continuously detect and resolve conflicts."""
-        while self._coordination_active:
-            try:
-                conflicts = self.detect_conflicts()
-                for conflict in conflicts:
-                    self.resolve_conflict(conflict['conflict_id'], "auto")
-            except Exception as e:
-                self.logger.error(f"Error in conflict detection: {e}")
-            time.sleep(self.intervals['conflict_detection'])
-
-    def _performance_assessment_loop(self) -> None:
-        """Continuously assess and update performance metrics."""
-        while self._coordination_active:
-            try:
-                self._assess_all_performance()
-            except Exception as e:
-                self.logger.error(f"Error in performance assessment: {e}")
-            time.sleep(self.intervals['performance_assessment'])
-
-    def _workload_distribution_loop(self) -> None:
-        """Continuously optimize workload distribution."""
-        while self._coordination_active:
-            try:
-                if self._work_queue:
-                    work_items = []
-                    # Process queued work in batches
-                    for _ in range(min(10, len(self._work_queue))):
-                        if self._work_queue:
-                            work_items.append(self._work_queue.popleft())
-
-                    if work_items:
-                        self.distribute_work(work_items)
-            except Exception as e:
-                self.logger.error(f"Error in workload distribution: {e}")
-            time.sleep(self.intervals['workload_distribution'])
+    def _run_scheduler(self) -> None:
+        """Fire due coordination ticks until coordination stops."""
+        scheduler = self._scheduler
+        while not self._coordination_stop.is_set():
+            delay = scheduler.run(blocking=False)
+            if delay is None:
+                break
+            # Sleep until the next due tick, or until a tick is woken early
+            self._scheduler_wakeup.wait(delay)
+            self._scheduler_wakeup.clear()
+
+    def _dispatch_tick(self, interval_name: str, tick: Callable[[], None],
+                       pending: Optional[Future]) -> None:
+        """Hand a due tick to the worker pool and schedule its next run."""
+        # stop_coordination clears the pool under the lock, so a tick firing
+        # while it shuts down sees None here rather than a dead executor
+        with self._lock:
+            executor, scheduler = self._executor, self._scheduler
+            if not self._coordination_active or executor is None or scheduler is None:
+                return
+            # A tick still running from its last slot is not started twice
+            if pending is None or pending.done():
+                pending = executor.submit(self._run_tick, interval_name, tick)
+            self._scheduled_ticks[interval_name] = scheduler.enter(
+                self.intervals[interval_name], 1, self._dispatch_tick, (interval_name, tick, pending))
+
+    def _wake_tick(self, interval_name: str) -> None:
+        """Run a coordination tick now instead of at the end of its interval."""
+        scheduler = self._scheduler
+        event = self._scheduled_ticks.get(interval_name)
+        if not self._coordination_active or scheduler is None or event is None:
+            return
+        try:
+            scheduler.cancel(event)
+        except ValueError:
+            return  # Already firing
+        self._scheduled_ticks[interval_name] = scheduler.enter(0, 1, event.action, event.argument)
+        self._scheduler_wakeup.set()
+
+    def _run_tick(self, interval_name: str, tick: Callable[[], None]) -> None:
+        try:
+            tick()
+        except Exception as e:
+            self.logger.error(f"Error in {interval_name.replace('_', ' ')}: {e}")
+
+    # Tick bodies, run on the coordination worker pool
+    WORK_BATCH_SIZE = 10  # Queued work items distributed per workload tick
+
+    def _team_rebalancing_tick(self) -> None:
+        """Rebalance teams for optimal performance."""
+        with self._coordination_tick():
+            self._rebalance_all_teams()
+
+    def _conflict_detection_tick(self) -> None:
+        """Detect and resolve conflicts."""
+        with self._coordination_tick():
+            conflicts = self.detect_conflicts()
+            for conflict in conflicts:
+                self.resolve_conflict(conflict['conflict_id'], "auto")
+
+    def _performance_assessment_tick(self) -> None:
+        """Assess and update performance metrics."""
+        with self._coordination_tick():
+            self._assess_all_performance()
+
+    def _workload_distribution_tick(self) -> None:
+        """Distribute the next batch of queued work."""
+        # Process queued work in batches. Only this tick consumes the queue
+        # (it never runs twice at once), so the length read up front holds
+        # while producers keep appending.
+        queue = self._work_queue
+        work_items = [queue.popleft() for _ in range(min(self.WORK_BATCH_SIZE, len(queue)))]
+
+        if work_items:
+            with self._coordination_tick():
+                self.distribute_work(work_items)
 
     # Helper methods for team formation and coordination
     def _get_available_agents(self, required_capabilities: List[AgentCapability],
                              preferred_agents: List[str] = None) -> List[str]:
         """Get agents available for team formation."""
-        available = []
-        for agent_name, profile in self._agent_profiles.items():
-            if preferred_agents and agent_name not in preferred_agents:
-                continue
-            if profile.health_status in [HealthLevel.CRITICAL, HealthLevel.OFFLINE]:
-                continue
-            if profile.current_load > 0.9:  # Too busy
-                continue
-            if any(cap in profile.capabilities for cap in required_capabilities):
-                available.append(agent_name)
-        return available
+        rows = self._available_rows(required_capabilities, preferred_agents)
+        return [self._agent_names[row] for row in rows.tolist()]
+
+    def _available_rows(self, required_capabilities: List[AgentCapability],
+                        preferred_agents: List[str] = None) -> np.ndarray:
+        """Array rows of agents available for team formation, in registration order."""
+        required_mask = capability_mask(required_capabilities)
+        # With preferred agents only their rows are checked, not every agent
+        rows = (self._preferred_rows(preferred_agents) if preferred_agents
+                else slice(0, len(self._agent_names)))
+
+        # Healthy enough, not too busy and holding any required capability,
+        # evaluated over all candidate rows at once
+        mask = ((self._health[rows] < CRITICAL_HEALTH_CODE)
+                & (self._load[rows] <= 0.9)
+                & ((self._caps_mask[rows] & required_mask) != 0))
+        return rows[mask] if preferred_agents else np.flatnonzero(mask)
+
+    def _preferred_rows(self, preferred_agents: List[str]) -> np.ndarray:
+        """Rows of the registered preferred agents, deduplicated, in registration order."""
+        agent_rows = self._agent_rows
+        return np.unique(np.fromiter((agent_rows[a] for a in preferred_agents if a in agent_rows),
+                                     dtype=np.intp))
+
+    def _sync_agent_arrays(self, profile: AgentProfile) -> None:
+        """Write a profile's scoring fields into its row of the agent arrays."""
+        row = self._agent_rows.get(profile.agent_name)
+        if row is None:
+            row = len(self._agent_names)
+            if row == len(self._perf):
+                self._grow_agent_arrays()
+            self._agent_names.append(profile.agent_name)
+            self._agent_rows[profile.agent_name] = row
+
+        self._perf[row] = profile.performance_rating
+        self._load[row] = profile.current_load
+        self._collab[row] = profile.collaboration_rating
+        self._health[row] = HEALTH_CODES[profile.health_status]
+        self._caps_mask[row] = capability_mask(profile.capabilities)
+
+    def _grow_agent_arrays(self) -> None:
+        """Double the capacity of the agent arrays."""
+        for attr in ('_perf', '_load', '_collab', '_health', '_caps_mask'):
+            arr = getattr(self, attr)
+            grown = np.zeros(len(arr) * 2, dtype=arr.dtype)
+            grown[:len(arr)] = arr
+            setattr(self, attr, grown)
+
+    @contextmanager
+    def _coordination_tick(self):
+        """
+        Scope one coordination tick on this thread: every timestamp taken
+        inside shares a single clock read, and team/profile writes are
+        flushed together when the tick ends.
+        """
+        if getattr(self._tick, 'now_ns', None) is not None:
+            yield  # Nested inside an enclosing tick
+            return
+
+        self._refresh_now()
+        try:
+            with self._batched_persistence():
+                yield
+        finally:
+            self._tick.now_ns = None
+            self._tick.now_iso = None
+
+    def _refresh_now(self) -> str:
+        """Read the clock once for the current tick on this thread."""
+        now_ns = time.time_ns()
+        self._tick.now_ns = now_ns
+        self._tick.now_iso = iso_from_ns(now_ns)
+        return self._tick.now_iso
+
+    def _now_ns(self) -> int:
+        """Current epoch time in ns, cached for the duration of a coordination tick."""
+        now_ns = getattr(self._tick, 'now_ns', None)
+        return now_ns if now_ns is not None else time.time_ns()
+
+    def _now_iso(self) -> str:
+        """ISO form of _now_ns(), formatted once per coordination tick."""
+        now_iso = getattr(self._tick, 'now_iso', None)
+        return now_iso if now_iso is not None else iso_from_ns(time.time_ns())
+
+    def _shift_team_performance(self, agent_name: str, delta: float) -> None:
+        """Keep cached team average performance in step with one agent's rating change."""
+        if not delta:
+            return
+        for team in self._active_teams.values():
+            if 'avg_performance' in team.performance_metrics and agent_name in team.member_agents:
+                team.performance_metrics['avg_performance'] += delta / len(team.member_agents)
+
+    def _new_team_id(self, prefix: str) -> str:
+        """Unique team id: type prefix, epoch second and a per-coordinator counter."""
+        return f"{prefix}_{self._now_ns() // NS_PER_SECOND}_{next(self._team_id_counter):x}"
+
+    def _rows_for(self, agents: List[str]) -> np.ndarray:
+        """Map agent names to their rows in the agent arrays."""
+        return np.fromiter((self._agent_rows[a] for a in agents), dtype=np.intp, count=len(agents))
 
     def _select_diverse_agents(self, agents: List[str], capabilities: List[AgentCapability],
                               target_count: int) -> List[str]:
@@ -940,95 +1510,82 @@ class SwarmCoordinator:
         if len(agents) <= target_count:
             return agents
 
-        selected = []
-        remaining = agents.copy()
-
-        # First, select agents with most required capabilities
-        capability_counts = []
-        for agent in agents:
-            profile = self._agent_profiles[agent]
-            count = sum(1 for cap in capabilities if cap in profile.capabilities)
-            capability_counts.append((agent, count))
-
-        capability_counts.sort(key=lambda x: x[1], reverse=True)
-
-        # Select top agents ensuring diversity
-        for agent, _ in capability_counts:
-            if len(selected) >= target_count:
-                break
-            selected.append(agent)
-
-        return selected[:target_count]
+        # Agents with the most required capabilities first; the stable sort
+        # keeps the input order among equal counts
+        required_mask = capability_mask(capabilities)
+        counts = [(caps & required_mask).bit_count()
+                  for caps in self._caps_mask[self._rows_for(agents)].tolist()]
+        order = sorted(range(len(agents)), key=counts.__getitem__, reverse=True)
+        return [agents[i] for i in order[:target_count]]
 
     def _infer_specializations(self, capabilities: List[AgentCapability]) -> Dict[WorkloadType, float]:
         """Infer workload specializations from agent capabilities."""
-        specializations = {}
-
-        # Map capabilities to workload types
-        capability_mapping = {
-            AgentCapability.FRONTEND_DEV: [WorkloadType.CREATIVE, WorkloadType.IO_BOUND],
-            AgentCapability.BACKEND_DEV: [WorkloadType.CPU_INTENSIVE, WorkloadType.ANALYTICAL],
-            AgentCapability.DATABASE_OPS: [WorkloadType.IO_BOUND, WorkloadType.MEMORY_INTENSIVE],
-            AgentCapability.TESTING: [WorkloadType.ANALYTICAL, WorkloadType.CPU_INTENSIVE],
-            AgentCapability.DOCUMENTATION: [WorkloadType.CREATIVE, WorkloadType.IO_BOUND],
-            AgentCapability.DEVOPS: [WorkloadType.COORDINATION_HEAVY, WorkloadType.ANALYTICAL],
-            AgentCapability.SECURITY: [WorkloadType.ANALYTICAL, WorkloadType.CPU_INTENSIVE],
-            AgentCapability.PERFORMANCE: [WorkloadType.CPU_INTENSIVE, WorkloadType.MEMORY_INTENSIVE],
-            AgentCapability.COORDINATION: [WorkloadType.COORDINATION_HEAVY],
-            AgentCapability.ANALYSIS: [WorkloadType.ANALYTICAL, WorkloadType.MEMORY_INTENSIVE]
-        }
-
-        # Initialize all workload types with base score
-        for workload_type in WorkloadType:
-            specializations[workload_type] = 0.2
-
-        # Increase scores based on capabilities
-        for capability in capabilities:
-            if capability in capability_mapping:
-                for workload_type in capability_mapping[capability]:
-                    specializations[workload_type] = min(0.9, specializations[workload_type] + 0.3)
-
-        return specializations
+        # Copy so callers can adjust the scores without touching the cache
+        return dict(_infer_specializations_cached(frozenset(capabilities)))
 
     def _get_health_emoji(self, health_level: HealthLevel) -> str:
         """Get emoji representation for health level."""
-        emoji_map = {
-            HealthLevel.HEALTHY: "🟢",
-            HealthLevel.DEGRADED: "🟡",
-            HealthLevel.STRUGGLING: "🟠",
-            HealthLevel.CRITICAL: "🔴",
-            HealthLevel.OFFLINE: "⚫"
-        }
-        return emoji_map.get(health_level, "❓")
+        return HEALTH_EMOJI.get(health_level, "❓")
 
     def _get_load_bar(self, load: float) -> str:
         """Get visual load bar representation."""
-        bar_length = 8
-        filled = int(load * bar_length)
-        bar = "█" * filled + "░" * (bar_length - filled)
-        return f"{bar} {load:.1%}"
+        filled = min(max(int(load * LOAD_BAR_LENGTH), 0), LOAD_BAR_LENGTH)
+        return f"{LOAD_BARS[filled]} {load:.1%}"
 
     # Placeholder methods for complex algorithms
     def _analyze_workload(self, work_items: List[str]) -> Dict[str, Any]:
         """Analyze workload characteristics for optimal distribution."""
         return {"complexity": "medium", "estimated_duration": len(work_items) * 30}
 
-    def _get_available_teams(self) -> List[Team]:
-        """Get teams available for additional work."""
-        return [team for team in self._active_teams.values()
-                if len(team.assigned_workload) < 5]  # Simple availability check
+    def _get_available_teams(self, k: Optional[int] = None) -> List[Team]:
+        """
+        Get teams available for additional work.
+
+        With k, only the k least loaded teams are returned, least loaded first
+        (ties keep formation order); without it, every available team in
+        formation order.
+        """
+        available = (team for team in self._active_teams.values()
+                     if len(team.assigned_workload) < 5)  # Simple availability check
+        if k is None:
+            return list(available)
+        return heapq.nsmallest(k, available, key=lambda team: len(team.assigned_workload))
 
     def _optimize_work_distribution(self, work_items: List[str], teams: List[Team],
                                    analysis: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Optimize distribution of work across teams."""
-        # Simple round-robin distribution for now
-        assignments = {}
-        for i, item in enumerate(work_items):
-            if teams:
-                team = teams[i % len(teams)]
-                if team.team_id not in assignments:
-                    assignments[team.team_id] = []
-                assignments[team.team_id].append(item)
+        """Optimize distribution of work across teams.
+
+        Each team's share is proportional to its capacity: the summed
+        performance of its members, discounted by coordination overhead and
+        by the work it already holds. Shares are rounded to whole items with
+        largest-remainder (Hamilton) apportionment.
+        """
+        assignments: Dict[str, List[str]] = {}
+        if not teams or not work_items:
+            return assignments
+
+        weights = np.fromiter(
+            (self._average_performance(team.member_agents) * len(team.member_agents)
+             * (1.0 - team.coordination_overhead) / (1 + len(team.assigned_workload))
+             for team in teams),
+            dtype=np.float64, count=len(teams))
+        total_weight = weights.sum()
+        if total_weight <= 0:
+            weights = np.ones(len(teams))
+            total_weight = float(len(teams))
+
+        quotas = weights / total_weight * len(work_items)
+        shares = np.floor(quotas).astype(np.int64)
+        leftover = len(work_items) - int(shares.sum())
+        if leftover:
+            # Largest fractional remainders first; ties go to the earlier team
+            shares[np.argsort(shares - quotas, kind='stable')[:leftover]] += 1
+
+        start = 0
+        for team, share in zip(teams, shares.tolist()):
+            if share:
+                assignments[team.team_id] = work_items[start:start + share]
+                start += share
         return assignments
 
     def _calculate_load_balance(self, assignments: Dict[str, List[str]]) -> float:
@@ -1036,12 +1593,10 @@ class SwarmCoordinator:
         if not assignments:
             return 1.0
 
-        work_counts = [len(work_list) for work_list in assignments.values()]
-        if not work_counts:
-            return 1.0
-
-        avg_work = sum(work_counts) / len(work_counts)
-        max_deviation = max(abs(count - avg_work) for count in work_counts)
+        work_counts = np.fromiter((len(work_list) for work_list in assignments.values()),
+                                  dtype=np.int64, count=len(assignments))
+        avg_work = float(work_counts.mean())
+        max_deviation = float(np.abs(work_counts - avg_work).max())
         return max(0.0, 1.0 - (max_deviation / max(avg_work, 1.0)))
 
     def _assess_conflict_risk(self, assignments: Dict[str, List[str]]) -> float:
@@ -1055,28 +1610,34 @@ class SwarmCoordinator:
         num_teams = len(assignments)
         return min(1.0, num_teams / 10.0)
 
+    def _average_performance(self, agents: List[str]) -> float:
+        """Mean performance rating of the given agents (0.0 for none)."""
+        if not agents:
+            return 0.0
+        return fmean(self._agent_profiles[agent].performance_rating for agent in agents)
+
     def _estimate_completion_time(self, assignments: Dict[str, List[str]]) -> str:
         """Estimate when all work will be completed."""
         if not assignments:
-            return datetime.now(timezone.utc).isoformat()
+            return self._now_iso()
 
         max_work = max(len(work_list) for work_list in assignments.values())
         estimated_hours = max_work * 0.5  # 30 minutes per work item
-        completion_time = datetime.now(timezone.utc) + timedelta(hours=estimated_hours)
-        return completion_time.isoformat()
+        return iso_from_ns(self._now_ns() + int(estimated_hours * NS_PER_HOUR))
 
-    def _estimate_team_completion(self, agents: List[str], workload: List[str], urgent: bool = False) -> str:
+    def _estimate_team_completion(self, agents: List[str], workload: List[str], urgent: bool = False,
+                                  avg_performance: Optional[float] = None) -> str:
         """Estimate when team will complete assigned workload."""
         if not agents or not workload:
-            return datetime.now(timezone.utc).isoformat()
+            return self._now_iso()
 
         # Base estimate: 30 minutes per work item per agent
         work_per_agent = len(workload) / len(agents)
         base_hours = work_per_agent * 0.5
 
         # Adjust for team efficiency
-        avg_performance = sum(self._agent_profiles[agent].performance_rating
-                            for agent in agents) / len(agents)
+        if avg_performance is None:
+            avg_performance = self._average_performance(agents)
         efficiency_multiplier = 0.5 + avg_performance  # 0.5 to 1.5 range
 
         adjusted_hours = base_hours / efficiency_multiplier
@@ -1084,8 +1645,7 @@ class SwarmCoordinator:
         if urgent:
             adjusted_hours *= 0.7  # Emergency teams work faster
 
-        completion_time = datetime.now(timezone.utc) + timedelta(hours=adjusted_hours)
-        return completion_time.isoformat()
+        return iso_from_ns(self._now_ns() + int(adjusted_hours * NS_PER_HOUR))
 
     # Conflict detection and resolution
     def _detect_resource_conflicts(self) -> List[Dict[str, Any]]:
@@ -1124,117 +1684,228 @@ class SwarmCoordinator:
         """Assess performance of all agents and teams."""
         pass  # Placeholder
 
+    def _record_performance_sample(self, entity: str, sample: np.ndarray) -> None:
+        """Write one PERFORMANCE_METRICS sample into an entity's history ring."""
+        ring, taken = self._performance_history.get(entity, (None, 0))
+        if ring is None:
+            ring = np.zeros((len(PERFORMANCE_METRICS), PERFORMANCE_HISTORY_SAMPLES), dtype=np.float32)
+        ring[:, taken % PERFORMANCE_HISTORY_SAMPLES] = sample
+        self._performance_history[entity] = (ring, taken + 1)
+
     def _get_performance_trends(self) -> Dict[str, Any]:
         """Get performance trends for dashboard."""
         return {"trend": "stable"}  # Placeholder
 
-    # Database persistence methods
+    # Database persistence methods; every write goes through the write queue
+    WRITE_FLUSH_INTERVAL = 0.1  # Seconds between background writer flushes
+
+    # Columns are ordered plain fields first, JSON-encoded fields last, so the
+    # plain part of each row comes from one attrgetter call
+    _AGENT_PROFILE_UPSERT = """
+        INSERT OR REPLACE INTO agent_profiles
+        (agent_name, performance_rating, current_load, health_status, last_active,
+         collaboration_rating, capabilities, specialization_score,
+         team_preferences, availability_window)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _AGENT_PROFILE_FIELDS = attrgetter(
+        'agent_name', 'performance_rating', 'current_load', 'health_status', 'last_active',
+        'collaboration_rating')
+
+    _TEAM_UPSERT = """
+        INSERT OR REPLACE INTO teams
+        (team_id, team_type, leader_agent, estimated_completion, coordination_overhead,
+         created_at, member_agents, assigned_workload, target_capability, performance_metrics)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _TEAM_FIELDS = attrgetter(
+        'team_id', 'team_type', 'leader_agent', 'estimated_completion', 'coordination_overhead',
+        'created_at')
+
+    _CONFLICT_INSERT = """
+        INSERT OR REPLACE INTO conflict_registry
+        (conflict_id, conflict_type, conflict_description, resolution_strategy,
+         status, created_at, resolved_at, involved_agents, involved_teams)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _CONFLICT_UPDATE = """
+        UPDATE conflict_registry
+        SET status = ?, resolved_at = ?, resolution_strategy = ?
+        WHERE conflict_id = ?
+    """
+
+    _PLAN_INSERT = """
+        INSERT OR REPLACE INTO work_distribution_plans
+        (plan_id, estimated_completion, load_balance_score, conflict_risk_score,
+         coordination_complexity, created_at, total_workload, team_assignments)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _PLAN_FIELDS = attrgetter(
+        'plan_id', 'estimated_completion', 'load_balance_score', 'conflict_risk_score',
+        'coordination_complexity', 'created_at')
+
+    def _queue_writes(self, sql: str, rows: List[Tuple], json_columns: int = 0) -> None:
+        """
+        Queue parameter rows for the background writer.
+
+        Rows are snapshots taken by the caller, with collections copied, so
+        later changes to the source objects do not leak into them. Their last
+        json_columns values are JSON-encoded on the writer thread at flush time.
+        """
+        if not rows:
+            return
+        self._write_queue.extend((sql, json_columns, row) for row in rows)
+        if self._writer_thread is None:
+            self._start_writer()
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._writer_lock:
+            if self._writer_thread is not None:
+                return
+            self._writer_stop.clear()
+            self._writer_thread = threading.Thread(
+                target=_run_writer,
+                args=(weakref.ref(self), self._writer_stop, self.WRITE_FLUSH_INTERVAL),
+                name="swarm_coordinator_writer",
+                daemon=True
+            )
+            self._writer_thread.start()
+
+    def _stop_writer(self) -> None:
+        """Stop the background writer and write whatever is still queued."""
+        with self._writer_lock:
+            thread, self._writer_thread = self._writer_thread, None
+            if thread is None:
+                return
+            self._writer_stop.set()
+        thread.join(timeout=5.0)
+        self.flush_writes()
+
+    def flush_writes(self) -> None:
+        """
+        Write every queued row now, in one transaction.
+
+        Raises if the write fails; the rows stay queued for the next flush.
+        """
+        _flush_write_queue(self._write_queue, self._db_pool, self._flush_lock)
+
+    @contextmanager
+    def _batched_persistence(self):
+        """
+        Defer agent profile and team writes made on this thread, then flush
+        them with executemany in one transaction when the block exits.
+        """
+        if getattr(self._write_batch, 'pending', None) is not None:
+            yield  # Already batching; the outermost block flushes
+            return
+
+        pending = self._write_batch.pending = {'profiles': [], 'teams': []}
+        try:
+            yield
+        finally:
+            self._write_batch.pending = None
+            self._persist_agent_profiles_bulk(pending['profiles'])
+            self._persist_teams_bulk(pending['teams'])
+
+    def _agent_profile_row(self, profile: AgentProfile) -> Tuple:
+        """Snapshot the agent_profiles parameters for a profile; 4 JSON columns."""
+        return self._AGENT_PROFILE_FIELDS(profile) + (
+            tuple(ordered_capabilities(profile.capabilities)),
+            dict(profile.specialization_score),
+            tuple(profile.team_preferences),
+            profile.availability_window or None
+        )
+
+    def _team_row(self, team: Team) -> Tuple:
+        """Snapshot the teams parameters for a team; 4 JSON columns."""
+        return self._TEAM_FIELDS(team) + (
+            tuple(team.member_agents),
+            tuple(team.assigned_workload),
+            tuple(team.target_capability),
+            dict(team.performance_metrics)
+        )
+
+    def _plan_row(self, plan: WorkDistributionPlan) -> Tuple:
+        """Snapshot the work_distribution_plans parameters for a plan; 2 JSON columns."""
+        return self._PLAN_FIELDS(plan) + (
+            tuple(plan.total_workload),
+            {team_id: tuple(items) for team_id, items in plan.team_assignments.items()}
+        )
+
+    @staticmethod
+    def _conflict_row(conflict: Dict[str, Any]) -> Tuple:
+        """Snapshot the conflict_registry parameters for a conflict; 2 JSON columns."""
+        return (
+            conflict['conflict_id'],
+            conflict['conflict_type'],
+            conflict['conflict_description'],
+            conflict.get('resolution_strategy'),
+            conflict['status'],
+            conflict['created_at'],
+            conflict.get('resolved_at'),
+            tuple(conflict['involved_agents']),
+            tuple(conflict['involved_teams'])
+        )
+
+    @staticmethod
+    def _conflict_update_row(conflict: Dict[str, Any]) -> Tuple:
+        """Build the conflict_registry status update parameter tuple for a conflict."""
+        return (
+            conflict['status'],
+            conflict.get('resolved_at'),
+            conflict.get('resolution_strategy'),
+            conflict['conflict_id']
+        )
+
     def _persist_agent_profile(self, profile: AgentProfile) -> None:
-        """Persist agent profile to database."""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO agent_profiles
-                (agent_name, capabilities, performance_rating, current_load, health_status,
-                 team_preferences, last_active, specialization_score, collaboration_rating,
-                 availability_window)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                profile.agent_name,
-                json.dumps([cap.value for cap in profile.capabilities]),
-                profile.performance_rating,
-                profile.current_load,
-                profile.health_status.value,
-                json.dumps([pref.value for pref in profile.team_preferences]),
-                profile.last_active,
-                json.dumps({k.value: v for k, v in profile.specialization_score.items()}),
-                profile.collaboration_rating,
-                json.dumps(profile.availability_window) if profile.availability_window else None
-            ))
-            conn.commit()
+        """Persist agent profile to database (deferred while batching)."""
+        pending = getattr(self._write_batch, 'pending', None)
+        if pending is not None:
+            pending['profiles'].append(profile)
+        else:
+            self._persist_agent_profiles_bulk([profile])
+
+    def _persist_agent_profiles_bulk(self, profiles: List[AgentProfile]) -> None:
+        """Queue several agent profiles for the background writer."""
+        if not profiles:
+            return
+        self._queue_writes(self._AGENT_PROFILE_UPSERT,
+                          [self._agent_profile_row(profile) for profile in profiles], 4)
 
     def _persist_team(self, team: Team) -> None:
-        """Persist team to database."""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO teams
-                (team_id, team_type, leader_agent, member_agents, assigned_workload,
-                 target_capability, estimated_completion, performance_metrics,
-                 coordination_overhead, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                team.team_id,
-                team.team_type.value,
-                team.leader_agent,
-                json.dumps(team.member_agents),
-                json.dumps(team.assigned_workload),
-                json.dumps([cap.value for cap in team.target_capability]),
-                team.estimated_completion,
-                json.dumps(team.performance_metrics),
-                team.coordination_overhead,
-                team.created_at
-            ))
-            conn.commit()
+        """Persist team to database (deferred while batching)."""
+        pending = getattr(self._write_batch, 'pending', None)
+        if pending is not None:
+            pending['teams'].append(team)
+        else:
+            self._persist_teams_bulk([team])
+
+    def _persist_teams_bulk(self, teams: List[Team]) -> None:
+        """Queue several teams for the background writer."""
+        if not teams:
+            return
+        self._queue_writes(self._TEAM_UPSERT, [self._team_row(team) for team in teams], 4)
 
     def _persist_distribution_plan(self, plan: WorkDistributionPlan) -> None:
         """Persist distribution plan to database."""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO work_distribution_plans
-                (plan_id, total_workload, team_assignments, estimated_completion,
-                 load_balance_score, conflict_risk_score, coordination_complexity, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                plan.plan_id,
-                json.dumps(plan.total_workload),
-                json.dumps(plan.team_assignments),
-                plan.estimated_completion,
-                plan.load_balance_score,
-                plan.conflict_risk_score,
-                plan.coordination_complexity,
-                plan.created_at
-            ))
-            conn.commit()
+        self._queue_writes(self._PLAN_INSERT, [self._plan_row(plan)], 2)
 
     def _persist_conflict(self, conflict: Dict[str, Any]) -> None:
         """Persist conflict to database."""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO conflict_registry
-                (conflict_id, conflict_type, involved_agents, involved_teams,
-                 conflict_description, resolution_strategy, status, created_at, resolved_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                conflict['conflict_id'],
-                conflict['conflict_type'],
-                json.dumps(conflict['involved_agents']),
-                json.dumps(conflict['involved_teams']),
-                conflict['conflict_description'],
-                conflict.get('resolution_strategy'),
-                conflict['status'],
-                conflict['created_at'],
-                conflict.get('resolved_at')
-            ))
-            conn.commit()
+        self._persist_conflicts_bulk([conflict])
+
+    def _persist_conflicts_bulk(self, conflicts: List[Dict[str, Any]]) -> None:
+        """Queue several conflicts for the background writer."""
+        if not conflicts:
+            return
+        self._queue_writes(self._CONFLICT_INSERT,
+                          [self._conflict_row(conflict) for conflict in conflicts], 2)
 
     def _update_conflict(self, conflict: Dict[str, Any]) -> None:
         """Update conflict in database."""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE conflict_registry
-                SET status = ?, resolved_at = ?, resolution_strategy = ?
-                WHERE conflict_id = ?
-            """, (
-                conflict['status'],
-                conflict.get('resolved_at'),
-                conflict.get('resolution_strategy'),
-                conflict['conflict_id']
-            ))
-            conn.commit()
+        self._queue_writes(self._CONFLICT_UPDATE, [self._conflict_update_row(conflict)])
 
 
 # Example usage and testing
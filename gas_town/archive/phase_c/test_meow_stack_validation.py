@@ -20,6 +20,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 from datetime import datetime
 
 # Add our modules to path
@@ -388,6 +389,7 @@ class TestMEOWStackValidation(unittest.TestCase):
                     "coordination_success": True
                 }
             )
+        coordinator.close()
 
         print("✅ MEOW-Swarm integration: FUNCTIONAL")
         print(f"   - Swarm team formed: {len(team.member_agents)} agents")
@@ -395,6 +397,34 @@ class TestMEOWStackValidation(unittest.TestCase):
         print("   - Integration working seamlessly")
 
 
+    def test_write_behind_retries_failed_flush(self):
+        """Test: Queued snapshots survive a failed write-behind flush."""
+        print("\n🔍 Testing Write-Behind Flush Retry...")
+
+        state = PersistentMoleculeState(
+            db_path=os.path.join(self.test_dir, "write_behind.db"),
+            write_behind=True
+        )
+        self.addCleanup(state.close)
+        state.WRITE_FLUSH_INTERVAL = 3600.0  # Flush by hand only
+
+        mol_id = "write-behind-molecule"
+        state.create_molecule(mol_id, "WriteBehindAgent", {"step": 0})
+        state.checkpoint_molecule(mol_id, {"step": 1}, MoleculeState.RUNNING, force=True)
+
+        with mock.patch.object(state, "_write_snapshots", side_effect=OSError("disk I/O error")):
+            with self.assertRaises(OSError):
+                state.flush_writes()
+        self.assertEqual(len(state._write_queue), 2)
+
+        state.flush_writes()
+        self.assertEqual(len(state._write_queue), 0)
+        history = state.get_molecule_history(mol_id)
+        self.assertEqual([snapshot.checkpoint_data["step"] for snapshot in history], [1, 0])
+
+        print("✅ Write-behind retry: FUNCTIONAL")
+
+
 def run_meow_validation_suite():
     """Run comprehensive MEOW stack validation."""
     print("🧬 MEOW STACK VALIDATION SUITE")
@@ -17,6 +17,11 @@ from pathlib import Path
 # Import Phase C components (basic functionality only)
 from persistent_molecule_state import PersistentMoleculeState, MoleculeState
 
+try:
+    import orjson  # Optional: faster serialization of the results report
+except ImportError:
+    orjson = None
+
 
 class PhaseC_BasicTester:
     """Basic integration tester for Gas Town Phase C core functionality."""
@@ -28,7 +33,8 @@ class PhaseC_BasicTester:
 
         # Initialize core component
         self.molecule_state = PersistentMoleculeState(
-            db_path=str(self.test_dir / "test_molecule_state.db")
+            db_path=str(self.test_dir / "test_molecule_state.db"),
+            durable=False  # Throwaway database, removed after the run
         )
 
         print(f"🧪 Phase C Basic Test initialized in {self.test_dir}")
@@ -156,11 +162,14 @@ class PhaseC_BasicTester:
 
             def create_molecules(thread_id):
                 try:
+                    # Per-thread id prefix and agent name, built once
+                    mol_prefix = f"concurrent_{thread_id}_"
+                    agent_name = f"Agent_{thread_id}"
                     for i in range(3):
-                        mol_id = f"concurrent_{thread_id}_{i}"
+                        mol_id = mol_prefix + str(i)
                         mol = self.molecule_state.create_molecule(
                             molecule_id=mol_id,
-                            agent_name=f"Agent_{thread_id}",
+                            agent_name=agent_name,
                             initial_data={"thread": thread_id, "index": i}
                         )
 
@@ -329,8 +338,11 @@ if __name__ == "__main__":
 
         # Save results
         results_file = Path("/home/ubuntu/projects/deere/gas_town/phase_c/basic_test_results.json")
-        with open(results_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(results_file, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                f.write(json.dumps(report, indent=2).encode())
         print(f"\n📄 Results saved to {results_file}")
 
         # Final assessment
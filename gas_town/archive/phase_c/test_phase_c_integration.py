@@ -836,7 +836,7 @@ class PhaseC_IntegrationTester:
             if hasattr(self, 'health_monitor'):
                 self.health_monitor.stop_monitoring()
             if hasattr(self, 'swarm_coordinator'):
-                self.swarm_coordinator.stop_coordination()
+                self.swarm_coordinator.close()
             if hasattr(self, 'ml_planner'):
                 self.ml_planner.stop_ml_planning()
 
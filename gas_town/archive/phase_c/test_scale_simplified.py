@@ -23,6 +23,10 @@ from typing import Dict, List, Any
 # Import core Phase C components
 from persistent_molecule_state import PersistentMoleculeState, MoleculeState
 
+# Checkpoint stages of the concurrent molecule workflow, with their progress
+_STAGES_WITH_PROGRESS = (("init", 0.25), ("process", 0.5), ("validate", 0.75), ("complete", 1.0))
+_PRIORITIES = ("high", "medium", "low")
+
 
 class SimplifiedScaleTester:
     """Simplified multi-agent scale testing focused on core functionality."""
@@ -33,9 +37,38 @@ class SimplifiedScaleTester:
         self.test_dir = Path(tempfile.mkdtemp(prefix="gas_town_scale_"))
         self.start_time = None
         self.end_time = None
+        self._state_pool: Dict[str, PersistentMoleculeState] = {}
+        self._pool_lock = threading.Lock()
+
+        # One worker pool for every test, sized for one thread per agent
+        self.executor = ThreadPoolExecutor(max_workers=target_agent_count)
 
         print(f"🚀 Simplified Scale Test initialized for {target_agent_count} agents")
 
+    def _make_state(self, db_path: str, **kwargs) -> PersistentMoleculeState:
+        """Build a molecule state for a throwaway test database.
+
+        PersistentMoleculeState already runs in WAL mode with a 30s busy
+        timeout; the test databases are deleted afterwards, so fsyncs are
+        skipped as well.
+        """
+        return PersistentMoleculeState(db_path=db_path, durable=False, **kwargs)
+
+    def _get_state(self, db_path: str, **kwargs) -> PersistentMoleculeState:
+        """Return the cached molecule state for db_path, creating it once.
+
+        Every state goes through this pool so cleanup() can close it; kwargs
+        only apply when the state is first created.
+        """
+        state = self._state_pool.get(db_path)
+        if state is None:
+            with self._pool_lock:
+                state = self._state_pool.get(db_path)
+                if state is None:
+                    state = self._make_state(db_path, **kwargs)
+                    self._state_pool[db_path] = state
+        return state
+
     def run_scale_tests(self) -> Dict[str, Any]:
         """Run core scale tests."""
         print("\n" + "=" * 70)
@@ -44,21 +77,24 @@ class SimplifiedScaleTester:
 
         self.start_time = time.time()
 
-        # Test 1: Concurrent molecule state operations
-        print("\n🧬 Test 1: Concurrent Molecule State Operations")
-        molecule_test = self._test_concurrent_molecules()
+        try:
+            # Test 1: Concurrent molecule state operations
+            print("\n🧬 Test 1: Concurrent Molecule State Operations")
+            molecule_test = self._test_concurrent_molecules()
 
-        # Test 2: Database performance under load
-        print("\n💾 Test 2: Database Performance Under Load")
-        database_test = self._test_database_performance()
+            # Test 2: Database performance under load
+            print("\n💾 Test 2: Database Performance Under Load")
+            database_test = self._test_database_performance()
 
-        # Test 3: Resource contention simulation
-        print("\n⚡ Test 3: Resource Contention Simulation")
-        contention_test = self._test_resource_contention()
+            # Test 3: Resource contention simulation
+            print("\n⚡ Test 3: Resource Contention Simulation")
+            contention_test = self._test_resource_contention()
 
-        # Test 4: Scale stress test
-        print("\n🚀 Test 4: Scale Stress Test")
-        stress_test = self._test_scale_stress()
+            # Test 4: Scale stress test
+            print("\n🚀 Test 4: Scale Stress Test")
+            stress_test = self._test_scale_stress()
+        finally:
+            self.executor.shutdown(wait=True)
 
         self.end_time = time.time()
 
@@ -68,78 +104,82 @@ class SimplifiedScaleTester:
         """Test concurrent molecule operations."""
         print("   Testing concurrent molecule creation and lifecycle...")
 
-        start_time = time.time()
         shared_db = str(self.test_dir / "shared_molecules.db")
-        molecule_state = PersistentMoleculeState(
-            db_path=shared_db,
-            checkpoint_interval=0.1  # Fast for testing
-        )
+        molecule_state = self._get_state(shared_db)
+
+        barrier = threading.Barrier(self.target_agent_count + 1)
 
         def agent_molecule_workflow(agent_id: int):
             """Molecule workflow for single agent."""
+            barrier.wait()
+            rng = random.Random(agent_id)
             try:
                 results = []
 
-                for mol_num in range(5):  # 5 molecules per agent
-                    mol_id = f"scale_mol_{agent_id}_{mol_num}"
-
-                    # Create molecule
-                    start_op = time.time()
-                    molecule = molecule_state.create_molecule(
-                        mol_id, f"ScaleAgent_{agent_id}",
-                        {
-                            "agent_id": agent_id,
-                            "mol_num": mol_num,
-                            "test_type": "scale",
-                            "priority": random.choice(["high", "medium", "low"])
-                        },
-                        gas_town_context={"scale_test": True}
-                    )
-
-                    # Multi-stage checkpointing
-                    stages = ["init", "process", "validate", "complete"]
-                    for i, stage in enumerate(stages):
-                        checkpoint_data = {
-                            "stage": stage,
-                            "progress": (i + 1) / len(stages),
-                            "timestamp": datetime.now().isoformat()
-                        }
-
-                        success = molecule_state.checkpoint_molecule(
-                            mol_id, checkpoint_data,
-                            MoleculeState.RUNNING,
-                            force=True  # Skip interval for testing
+                # One transaction, and one commit, per agent
+                with molecule_state.transaction():
+                    for mol_num in range(5):  # 5 molecules per agent
+                        mol_id = f"scale_mol_{agent_id}_{mol_num}"
+
+                        # Create molecule
+                        start_op = time.time()
+                        molecule = molecule_state.create_molecule(
+                            mol_id, f"ScaleAgent_{agent_id}",
+                            {
+                                "agent_id": agent_id,
+                                "mol_num": mol_num,
+                                "test_type": "scale",
+                                "priority": rng.choice(_PRIORITIES)
+                            },
+                            gas_town_context={"scale_test": True}
                         )
 
-                        if not success:
-                            raise Exception(f"Checkpoint failed for {mol_id} stage {stage}")
+                        # Multi-stage checkpointing
+                        for stage, progress in _STAGES_WITH_PROGRESS:
+                            checkpoint_data = {
+                                "stage": stage,
+                                "progress": progress,
+                                "timestamp": time.monotonic_ns()
+                            }
+
+                            # Intermediate stages honour the interval; the final one is kept
+                            final_stage = stage == "complete"
+                            success = molecule_state.checkpoint_molecule(
+                                mol_id, checkpoint_data,
+                                MoleculeState.RUNNING,
+                                force=final_stage
+                            )
+
+                            if final_stage and not success:
+                                raise Exception(f"Checkpoint failed for {mol_id} stage {stage}")
 
-                    # Complete molecule
-                    molecule_state.complete_molecule(mol_id, {"final_stage": "completed"})
+                        # Complete molecule
+                        molecule_state.complete_molecule(mol_id, {"final_stage": "completed"})
 
-                    op_time = time.time() - start_op
-                    results.append({
-                        "mol_id": mol_id,
-                        "time": op_time,
-                        "stages": len(stages),
-                        "success": True
-                    })
+                        op_time = time.time() - start_op
+                        results.append({
+                            "mol_id": mol_id,
+                            "time": op_time,
+                            "stages": len(_STAGES_WITH_PROGRESS),
+                            "success": True
+                        })
 
                 return {"agent_id": agent_id, "molecules": results, "success": True}
 
             except Exception as e:
                 return {"agent_id": agent_id, "error": str(e), "success": False}
 
-        # Run concurrent workflows
+        # Run concurrent workflows, timed from the synchronized start
         operations = []
-        with ThreadPoolExecutor(max_workers=self.target_agent_count) as executor:
-            futures = [
-                executor.submit(agent_molecule_workflow, i)
-                for i in range(self.target_agent_count)
-            ]
+        futures = [
+            self.executor.submit(agent_molecule_workflow, i)
+            for i in range(self.target_agent_count)
+        ]
+        barrier.wait()
+        start_time = time.time()
 
-            for future in as_completed(futures):
-                operations.append(future.result())
+        for future in as_completed(futures):
+            operations.append(future.result())
 
         duration = time.time() - start_time
         successful_agents = [op for op in operations if op.get("success", False)]
@@ -160,14 +200,18 @@ class SimplifiedScaleTester:
         """Test database performance under concurrent access."""
         print("   Testing database performance with concurrent access...")
 
-        start_time = time.time()
+        db_paths = [str(self.test_dir / f"db_agent_{i}.db") for i in range(self.target_agent_count)]
+        for db_path in db_paths:
+            self._get_state(db_path)
+
+        barrier = threading.Barrier(self.target_agent_count + 1)
         operations = []
 
         def database_stress_test(agent_id: int):
             """Database stress test for single agent."""
+            barrier.wait()
             try:
-                db_path = str(self.test_dir / f"db_agent_{agent_id}.db")
-                molecule_state = PersistentMoleculeState(db_path=db_path)
+                molecule_state = self._get_state(db_paths[agent_id])
 
                 op_times = []
 
@@ -204,15 +248,16 @@ class SimplifiedScaleTester:
             except Exception as e:
                 return {"agent_id": agent_id, "error": str(e), "success": False}
 
-        # Run database stress tests
-        with ThreadPoolExecutor(max_workers=self.target_agent_count) as executor:
-            futures = [
-                executor.submit(database_stress_test, i)
-                for i in range(self.target_agent_count)
-            ]
+        # Run database stress tests, timed from the synchronized start
+        futures = [
+            self.executor.submit(database_stress_test, i)
+            for i in range(self.target_agent_count)
+        ]
+        barrier.wait()
+        start_time = time.time()
 
-            for future in as_completed(futures):
-                operations.append(future.result())
+        for future in as_completed(futures):
+            operations.append(future.result())
 
         duration = time.time() - start_time
         successful_ops = [op for op in operations if op.get("success", False)]
@@ -233,20 +278,25 @@ class SimplifiedScaleTester:
         """Test resource contention and conflict resolution."""
         print("   Testing resource contention with shared access...")
 
-        start_time = time.time()
+        db_paths = [str(self.test_dir / f"contention_agent_{i}.db") for i in range(self.target_agent_count)]
+        for db_path in db_paths:
+            self._get_state(db_path)
+
+        barrier = threading.Barrier(self.target_agent_count + 1)
         shared_resources = ["shared_resource_A", "shared_resource_B", "shared_resource_C"]
         contention_results = []
 
         def resource_contention_test(agent_id: int):
             """Resource contention test for single agent."""
+            barrier.wait()
+            rng = random.Random(agent_id)
             try:
-                db_path = str(self.test_dir / f"contention_agent_{agent_id}.db")
-                molecule_state = PersistentMoleculeState(db_path=db_path)
+                molecule_state = self._get_state(db_paths[agent_id])
 
                 access_results = []
 
                 for attempt in range(10):  # 10 resource access attempts
-                    resource = random.choice(shared_resources)
+                    resource = rng.choice(shared_resources)
 
                     # Simulate exclusive access with potential conflicts
                     access_start = time.time()
@@ -265,7 +315,7 @@ class SimplifiedScaleTester:
                         )
 
                         # Simulate holding resource
-                        hold_time = random.uniform(0.01, 0.03)
+                        hold_time = rng.uniform(0.01, 0.03)
                         time.sleep(hold_time)
 
                         # Release resource
@@ -280,7 +330,7 @@ class SimplifiedScaleTester:
 
                     except Exception as e:
                         # Simulate conflict resolution with retry
-                        time.sleep(random.uniform(0.01, 0.05))  # Backoff
+                        time.sleep(rng.uniform(0.01, 0.05))  # Backoff
 
                         try:
                             # Retry
@@ -318,15 +368,16 @@ class SimplifiedScaleTester:
             except Exception as e:
                 return {"agent_id": agent_id, "error": str(e), "success": False}
 
-        # Run contention tests
-        with ThreadPoolExecutor(max_workers=self.target_agent_count) as executor:
-            futures = [
-                executor.submit(resource_contention_test, i)
-                for i in range(self.target_agent_count)
-            ]
+        # Run contention tests, timed from the synchronized start
+        futures = [
+            self.executor.submit(resource_contention_test, i)
+            for i in range(self.target_agent_count)
+        ]
+        barrier.wait()
+        start_time = time.time()
 
-            for future in as_completed(futures):
-                contention_results.append(future.result())
+        for future in as_completed(futures):
+            contention_results.append(future.result())
 
         duration = time.time() - start_time
         successful_tests = [r for r in contention_results if r.get("success", False)]
@@ -352,18 +403,19 @@ class SimplifiedScaleTester:
         """Final scale stress test with maximum load."""
         print(f"   Testing maximum scale stress with {self.target_agent_count} agents...")
 
-        start_time = time.time()
+        # One state on a shared database for maximum contention
+        molecule_state = self._get_state(
+            str(self.test_dir / "stress_test_shared.db"),
+            checkpoint_interval=0.01  # Very fast checkpoints
+        )
+
+        barrier = threading.Barrier(self.target_agent_count + 1)
         stress_results = []
 
         def scale_stress_test(agent_id: int):
             """Full scale stress test for single agent."""
+            barrier.wait()
             try:
-                # Use shared database for maximum contention
-                shared_db = str(self.test_dir / "stress_test_shared.db")
-                molecule_state = PersistentMoleculeState(
-                    db_path=shared_db,
-                    checkpoint_interval=0.01  # Very fast checkpoints
-                )
 
                 operations_completed = 0
                 start_agent = time.time()
@@ -405,15 +457,16 @@ class SimplifiedScaleTester:
             except Exception as e:
                 return {"agent_id": agent_id, "error": str(e), "success": False}
 
-        # Run stress test with all agents simultaneously
-        with ThreadPoolExecutor(max_workers=self.target_agent_count) as executor:
-            futures = [
-                executor.submit(scale_stress_test, i)
-                for i in range(self.target_agent_count)
-            ]
+        # Run stress test with all agents released simultaneously
+        futures = [
+            self.executor.submit(scale_stress_test, i)
+            for i in range(self.target_agent_count)
+        ]
+        barrier.wait()
+        start_time = time.time()
 
-            for future in as_completed(futures):
-                stress_results.append(future.result())
+        for future in as_completed(futures):
+            stress_results.append(future.result())
 
         duration = time.time() - start_time
         successful_agents = [r for r in stress_results if r.get("success", False)]
@@ -515,7 +568,13 @@ class SimplifiedScaleTester:
 
     def cleanup(self):
         """Clean up test environment."""
+        self.executor.shutdown(wait=True)
         try:
+            with self._pool_lock:
+                states = list(self._state_pool.values())
+                self._state_pool.clear()
+            for state in states:
+                state.close()
             if self.test_dir.exists():
                 shutil.rmtree(self.test_dir)
             print(f"🧹 Scale test cleanup completed")